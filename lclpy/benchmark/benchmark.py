@@ -1,7 +1,31 @@
 from random import seed
+from multiprocessing import Pool
 
 
-def benchmark(problems, algorithms, stop_criterion, runs=10, seeds=None):
+def _run_with_seed(algorithm, run_seed):
+    """Resets an algorithm and runs it with a specific seed.
+
+    Parameters
+    ----------
+    algorithm : AbstractLocalSearch
+        The algorithm to run.
+    run_seed : int
+        The seed used for the random module.
+
+    Returns
+    -------
+    namedtuple
+        The results of the algorithm.
+
+    """
+
+    seed(run_seed)
+    algorithm.reset()
+    return algorithm.run()
+
+
+def benchmark(problems, algorithms, stop_criterion, runs=10, seeds=None,
+              processes=None):
     """A function to perform multiple algorithms on multiple soltions.
 
     Note that the problems, algorithms and the stop criterion all need to have
@@ -28,6 +52,14 @@ def benchmark(problems, algorithms, stop_criterion, runs=10, seeds=None):
         The seeds that will be used in the runs. Note that the length of the
         tuple or array needs to be equal to the amount of runs. If no seeds are
         given the seeds will be the number of the run.
+    processes : int, optional
+        The amount of worker processes used to perform the runs of an
+        algorithm-problem pair in parallel. Every run is performed on a copy
+        of the algorithm, problem and termination criterion, so all of them
+        need to be picklable. The progress is printed once before and once
+        after all runs of an algorithm-problem pair, instead of for every run.
+        The default is None, which performs all runs one after another in the
+        current process.
 
     Returns
     -------
@@ -46,6 +78,51 @@ def benchmark(problems, algorithms, stop_criterion, runs=10, seeds=None):
     if seeds is None:
         seeds = range(runs)
 
+    if processes is None:
+        pool = None
+    else:
+        pool = Pool(processes)
+
+    try:
+        results = _run_benchmark(problems, algorithms, stop_criterion, seeds,
+                                 pool)
+
+    finally:
+        # the runs are finished or one of them failed, either way the worker
+        # processes aren't needed anymore
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return results
+
+
+def _run_benchmark(problems, algorithms, stop_criterion, seeds, pool):
+    """Performs all runs of a benchmark.
+
+    Parameters
+    ----------
+    problems : iterable object
+        Contains all the problems.
+    algorithms : iterable object
+        Contains all the algorithms.
+    stop_criterion : AbstractTerminationCriterion
+        The termination criterion that will be used for all combinations of
+        algorithms and problems.
+    seeds : iterable object of int
+        The seeds that will be used in the runs.
+    pool : multiprocessing.pool.Pool or None
+        The pool used to perform the runs of an algorithm-problem pair in
+        parallel. If None, the runs are performed one after another in the
+        current process.
+
+    Returns
+    -------
+    list of list of list of namedtuple
+        The results of the benchmark, see benchmark.
+
+    """
+
     results = []
 
     algorithm_number = 0
@@ -70,13 +147,22 @@ def benchmark(problems, algorithms, stop_criterion, runs=10, seeds=None):
 
             print('--|---  Starting runs for problem ' + str(problem_number))
 
-            for i in seeds:
-                print('----|---  Starting run for seed ' + str(i))
-                seed(i)
-                algorithm.reset()
-                different_seed_results.append(algorithm.run())
-                print('----|--- Completed run for seed ' + str(i))
-                seed_number += 1
+            if pool is not None:
+                seeds_string = ', '.join(str(i) for i in seeds)
+                print('----|---  Starting runs for seeds ' + seeds_string)
+                # every worker gets a pickled copy of the algorithm
+                different_seed_results = pool.starmap(
+                    _run_with_seed, [(algorithm, i) for i in seeds])
+                print('----|--- Completed runs for seeds ' + seeds_string)
+                seed_number += len(different_seed_results)
+
+            else:
+                for i in seeds:
+                    print('----|---  Starting run for seed ' + str(i))
+                    different_seed_results.append(
+                        _run_with_seed(algorithm, i))
+                    print('----|--- Completed run for seed ' + str(i))
+                    seed_number += 1
 
             results_single_algorithm.append(different_seed_results)
 
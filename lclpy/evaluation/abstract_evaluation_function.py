@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from lclpy.evaluation.deltaeval.delta_eval_func import delta_eval_func
 
 
 class AbstractEvaluationFunction(ABC):
@@ -8,6 +9,8 @@ class AbstractEvaluationFunction(ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -22,6 +25,32 @@ class AbstractEvaluationFunction(ABC):
         """
         raise NotImplementedError
 
+    def set_move_function(self, move_function):
+        """Enables delta evaluation for a move function.
+
+        The object used for delta evaluation is retrieved with delta_eval_func
+        and its delta_evaluate method replaces delta_evaluate. This allows an
+        evaluation function to be created without a move function, the move
+        function can be set afterwards or replaced by another move function
+        without creating a new evaluation function.
+
+        Parameters
+        ----------
+        move_function : AbstractMove
+            The move function that will be used with delta_evaluate.
+
+        Raises
+        ------
+        NotImplementedError
+            If get_problem_type isn't implemented or if there is no delta
+            evaluation for the combination of the problem type and the move
+            type.
+
+        """
+
+        self._delta_evaluate_object = delta_eval_func(self, move_function)
+        self.delta_evaluate = self._delta_evaluate_object.delta_evaluate
+
     @abstractmethod
     def evaluate(self, current_data):
         """Evaluates current_solution
@@ -4,6 +4,14 @@ from lclpy.evaluation.deltaeval.delta_tsp import delta_tsp
 from lclpy.evaluation.deltaeval.delta_qap import delta_qap
 
 
+# maps the supported problem types on the functions that return the
+# delta-evaluation classes
+_DELTA_EVAL_FUNCTIONS = {
+    'TSP': delta_tsp,
+    'QAP': delta_qap,
+}
+
+
 def delta_eval_func(problem_eval_func, move_func):
     """A function to retrieve classes and functions needed for delta evaluation.
 
@@ -19,16 +27,25 @@ def delta_eval_func(problem_eval_func, move_func):
     object
         A class with a function delta_evaluate to perform delta evaluation.
 
+    Raises
+    ------
+    NotImplementedError
+        If there is no delta evaluation for the combination of the problem
+        type and the move type.
+
     """
 
+    if move_func.get_move_type() == 'multi_neighbourhood':
+        return delta_multi_neighbourhood(problem_eval_func, move_func)
+
     problem_type = problem_eval_func.get_problem_type()
-    move_type = move_func.get_move_type()
 
-    if move_type is 'multi_neighbourhood':
-        return delta_multi_neighbourhood(problem_eval_func, move_func)
-    if problem_type is 'TSP':
-        return delta_tsp(problem_eval_func, move_func)
-    elif problem_type is 'QAP':
-        return delta_qap(problem_eval_func, move_func)
-    else:
-        raise NotImplementedError
+    try:
+        delta_func = _DELTA_EVAL_FUNCTIONS[problem_type]
+    except KeyError:
+        raise NotImplementedError(
+            'No delta evaluation for problem type %r, supported problem '
+            'types are %s.' % (problem_type, list(_DELTA_EVAL_FUNCTIONS))) \
+            from None
+
+    return delta_func(problem_eval_func, move_func)
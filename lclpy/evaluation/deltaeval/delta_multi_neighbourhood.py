@@ -56,10 +56,6 @@ class MultiMoveDeltaEvaluate():
 def delta_multi_neighbourhood(eval_func, move_func):
     """Returns delta-eval class for a problem with a multi-neighbourhood.
 
-    Note that if no methods for a move or the evaluation function can be found,
-    that a placeholder method will be used. The placeholder methods will raise
-    a NotImplementedError when called.
-
     Parameters
     ----------
     eval_func : AbstractEvaluationFunction
@@ -72,6 +68,11 @@ def delta_multi_neighbourhood(eval_func, move_func):
     MultiMoveDeltaEvaluate
         Class useable for delta evaluation of TSP problems.
 
+    Raises
+    ------
+    NotImplementedError
+        If there is no delta evaluation for one of the moves in move_func.
+
     """
 
     return MultiMoveDeltaEvaluate(eval_func, move_func)
@@ -1,6 +1,3 @@
-from lclpy.aidfunc.error_func import _not_implemented
-
-
 # base class for the tsp delta evaluation
 
 class QAPDeltaEvaluate():
@@ -58,6 +55,12 @@ class QAPDeltaEvaluate():
 
         """
 
+        # local references, the inner loop uses them for every location
+        distance_matrix = self.eval_func._distance_matrix
+        flow_matrix = self.eval_func._flow_matrix
+        size = self.eval_func._size
+        next_to_current = self.next_to_current
+
         # get the changed locations
         # these are represented as a set of ints
         changed = self.changed_locations(move)
@@ -73,23 +76,22 @@ class QAPDeltaEvaluate():
 
             visited.add(location)
 
-            next_location = self.next_to_current(location, move)
+            next_location = next_to_current(location, move)
 
-            for i in range(self.eval_func._size):
+            for i in range(size):
 
                 if i not in visited:
 
                     current_solution_value += \
-                        self.eval_func._distance_matrix[location][i] * \
-                        self.eval_func._flow_matrix[
-                            current_order[location]][current_order[i]]
+                        distance_matrix[location, i] * \
+                        flow_matrix[current_order[location], current_order[i]]
 
-                    next_i = self.next_to_current(i, move)
+                    next_i = next_to_current(i, move)
 
                     next_solution_value += \
-                        self.eval_func._distance_matrix[location][i] * \
-                        self.eval_func._flow_matrix[
-                            current_order[next_location]][current_order[next_i]]
+                        distance_matrix[location, i] * \
+                        flow_matrix[current_order[next_location],
+                                    current_order[next_i]]
 
         return next_solution_value - current_solution_value
 
@@ -354,13 +356,19 @@ def delta_evaluate(eval_func, current_order, move):
 
 # The method to return the other stuff
 
+# maps the supported move types on the functions used by QAPDeltaEvaluate
+_QAP_DELTA_FUNCTIONS = {
+    'array_swap': (array_swap_changed_locations,
+                   array_swap_transform_next_index_to_current_index),
+    'array_reverse_order': (
+        array_reverse_order_changed_locations,
+        array_reverse_order_transform_next_index_to_current_index),
+}
+
+
 def delta_qap(eval_func, move_func):
     """Returns delta-eval class for a QAP problem.
 
-    Note that if a method for the problem can't be found, that a placeholder
-    method will be used. This method will raise a NotImplementedError when
-    called.
-
     Parameters
     ----------
     eval_func : AbstractEvaluationFunction
@@ -371,19 +379,22 @@ def delta_qap(eval_func, move_func):
     Returns
     -------
     QAPDeltaEvaluate
-        Class useable for delta evaluation of TSP problems.
+        Class useable for delta evaluation of QAP problems.
+
+    Raises
+    ------
+    NotImplementedError
+        If there is no delta evaluation for the move type of move_func.
 
     """
 
     move_type = move_func.get_move_type()
 
-    if move_type is 'array_swap':
-        return QAPDeltaEvaluate(eval_func,
-                                array_swap_changed_locations,
-                                array_swap_transform_next_index_to_current_index)
-    if move_type is 'array_reverse_order':
-        return QAPDeltaEvaluate(eval_func,
-                                array_reverse_order_changed_locations,
-                                array_reverse_order_transform_next_index_to_current_index)
-    else:
-        raise NotImplementedError
+    try:
+        changed_locations, next_to_current = _QAP_DELTA_FUNCTIONS[move_type]
+    except KeyError:
+        raise NotImplementedError(
+            'No QAP delta evaluation for move type %r, supported move types '
+            'are %s.' % (move_type, list(_QAP_DELTA_FUNCTIONS))) from None
+
+    return QAPDeltaEvaluate(eval_func, changed_locations, next_to_current)
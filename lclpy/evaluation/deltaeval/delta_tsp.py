@@ -1,4 +1,5 @@
-from lclpy.aidfunc.error_func import _not_implemented
+from functools import partial
+import numpy
 
 
 # base class for the tsp delta evaluation
@@ -61,6 +62,9 @@ class TSPDeltaEvaluate():
 
         """
 
+        distance_matrix = self.eval_func._distance_matrix
+        next_to_current = self.next_to_current
+
         # get the changed distances
         # these are represented as a set of tuples of 2 ints that represent
         # the 2 unique indices between which the distance is changed.
@@ -80,21 +84,246 @@ class TSPDeltaEvaluate():
             to = distances[1]
 
             # add distance to current value
-            current_solution_value += self.eval_func._distance_matrix[
-                current_order[frm]][current_order[to]]
+            current_solution_value += \
+                distance_matrix[current_order[frm], current_order[to]]
 
             # add distance to the "next" value
 
             # transform the indices so the indices return the value if the
             # move was performed
-            (frm, to) = self.next_to_current(frm, to, move)
+            (frm, to) = next_to_current(frm, to, move)
 
-            next_solution_value += self.eval_func._distance_matrix[
-                current_order[frm]][current_order[to]]
+            next_solution_value += \
+                distance_matrix[current_order[frm], current_order[to]]
 
         return next_solution_value - current_solution_value
 
 
+class TSPArraySwapDeltaEvaluate():
+    """Class to perform delta-evaluation for TSP problems with array_swap.
+
+    Only the at most 4 distances next to the 2 swapped positions change, so
+    they are read directly from the distance matrix. The distance matrix is
+    allowed to be asymmetric.
+
+    Parameters
+    ----------
+    eval_func : AbstractEvaluationFunction
+        The used evaluation function
+
+    Attributes
+    ----------
+    eval_func : AbstractEvaluationFunction
+        The used evaluation function
+
+    Examples
+    --------
+    The results are equal to those of the generic TSPDeltaEvaluate, including
+    the moves that swap neighbouring positions:
+
+    .. doctest::
+
+        >>> import numpy
+        >>> from lclpy.evaluation.tsp_evaluation_function \\
+        ...     import TspEvaluationFunction
+        >>> from lclpy.evaluation.deltaeval.delta_tsp import \\
+        ...     TSPDeltaEvaluate, TSPArraySwapDeltaEvaluate, \\
+        ...     array_swap_changed_distances, \\
+        ...     array_swap_transform_next_index_to_current_index
+        ... # init an asymmetric distance matrix
+        >>> distance_matrix = numpy.array(
+        ... [[0, 2, 5, 8, 3],
+        ...  [4, 0, 4, 1, 9],
+        ...  [5, 6, 0, 7, 2],
+        ...  [8, 1, 3, 0, 6],
+        ...  [1, 7, 2, 5, 0]])
+        >>> eval_func = TspEvaluationFunction(distance_matrix)
+        >>> generic = TSPDeltaEvaluate(
+        ...     eval_func, array_swap_changed_distances,
+        ...     array_swap_transform_next_index_to_current_index)
+        >>> swap = TSPArraySwapDeltaEvaluate(eval_func)
+        ... # tests
+        >>> order = numpy.array([3, 0, 4, 1, 2])
+        >>> swap.delta_evaluate(order, (1, 3))
+        -6
+        >>> all(swap.delta_evaluate(order, (i, j)) ==
+        ...     generic.delta_evaluate(order, (i, j))
+        ...     for i in range(5) for j in range(i + 1, 5))
+        True
+
+    """
+
+    def __init__(self, eval_func):
+        self.eval_func = eval_func
+
+    def delta_evaluate(self, current_order, move):
+        """Calculates the difference in quality if the move would be performed.
+
+        Parameters
+        ----------
+        current_order : numpy.ndarray
+            A 1 dimensional array that contains the order of the points to
+            visit. All values are unique and are within the interval [0,size[.
+            This is the current order.
+        move : tuple of int
+            Contains the move one wishes to know the effects on the quality of.
+
+        Returns
+        -------
+        int or float
+            The difference in quality if the move would be performed.
+
+        """
+
+        distance = self.eval_func._distance_matrix
+        size = self.eval_func._size
+
+        (i, j) = move
+        if j < i:
+            i, j = j, i
+
+        # with less than 3 points, every order is the same tour
+        if size < 3:
+            return 0
+
+        a = current_order[i]
+        b = current_order[j]
+
+        # index -1 is the last position, which is the predecessor of 0
+        if j == i + 1:
+            # a and b are neighbours: before -> a -> b -> after
+            before = current_order[i - 1]
+            after = current_order[(j + 1) % size]
+
+            current_value = \
+                distance[before, a] + distance[a, b] + distance[b, after]
+            next_value = \
+                distance[before, b] + distance[b, a] + distance[a, after]
+
+        elif i == 0 and j == size - 1:
+            # b and a are neighbours over the end: before -> b -> a -> after
+            before = current_order[j - 1]
+            after = current_order[1]
+
+            current_value = \
+                distance[before, b] + distance[b, a] + distance[a, after]
+            next_value = \
+                distance[before, a] + distance[a, b] + distance[b, after]
+
+        else:
+            before_a = current_order[i - 1]
+            after_a = current_order[i + 1]
+            before_b = current_order[j - 1]
+            after_b = current_order[(j + 1) % size]
+
+            current_value = \
+                distance[before_a, a] + distance[a, after_a] + \
+                distance[before_b, b] + distance[b, after_b]
+            next_value = \
+                distance[before_a, b] + distance[b, after_a] + \
+                distance[before_b, a] + distance[a, after_b]
+
+        return next_value - current_value
+
+    def delta_evaluate_all(self, current_order, moves):
+        """Calculates the difference in quality for many moves at once.
+
+        The results are equal to those of delta_evaluate, but all moves are
+        evaluated with a few vectorized numpy operations.
+
+        Parameters
+        ----------
+        current_order : numpy.ndarray
+            A 1 dimensional array that contains the order of the points to
+            visit. All values are unique and are within the interval [0,size[.
+            This is the current order.
+        moves : numpy.ndarray
+            A 2 dimensional array of int, every row contains the 2 indices of
+            a move.
+
+        Returns
+        -------
+        numpy.ndarray
+            The difference in quality for each move, in the order of moves.
+
+        Examples
+        --------
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.evaluation.deltaeval.delta_tsp import \\
+            ...     TSPArraySwapDeltaEvaluate
+            ... # init an asymmetric distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8, 3],
+            ...  [4, 0, 4, 1, 9],
+            ...  [5, 6, 0, 7, 2],
+            ...  [8, 1, 3, 0, 6],
+            ...  [1, 7, 2, 5, 0]])
+            >>> eval_func = TspEvaluationFunction(distance_matrix)
+            >>> swap = TSPArraySwapDeltaEvaluate(eval_func)
+            ... # tests
+            >>> order = numpy.array([3, 0, 4, 1, 2])
+            >>> moves = numpy.array([(i, j) for i in range(5)
+            ...                      for j in range(i + 1, 5)])
+            >>> deltas = swap.delta_evaluate_all(order, moves)
+            >>> deltas[moves.tolist().index([1, 3])]
+            -6
+            >>> all(deltas[k] == swap.delta_evaluate(order, tuple(move))
+            ...     for k, move in enumerate(moves.tolist()))
+            True
+
+        """
+
+        distance = self.eval_func._distance_matrix
+        size = self.eval_func._size
+
+        # with less than 3 points, every order is the same tour
+        if size < 3:
+            return numpy.zeros(len(moves), dtype=distance.dtype)
+
+        i = moves.min(axis=1)
+        j = moves.max(axis=1)
+
+        a = current_order[i]
+        b = current_order[j]
+        before_a = current_order[i - 1]
+        after_a = current_order[(i + 1) % size]
+        before_b = current_order[j - 1]
+        after_b = current_order[(j + 1) % size]
+
+        # the same sums as in delta_evaluate, so the results are identical
+
+        # a and b aren't neighbours
+        current_value = \
+            distance[before_a, a] + distance[a, after_a] + \
+            distance[before_b, b] + distance[b, after_b]
+        next_value = \
+            distance[before_a, b] + distance[b, after_a] + \
+            distance[before_b, a] + distance[a, after_b]
+        delta = next_value - current_value
+
+        # a and b are neighbours: before_a -> a -> b -> after_b
+        neighbours = j == i + 1
+        current_value = \
+            distance[before_a, a] + distance[a, b] + distance[b, after_b]
+        next_value = \
+            distance[before_a, b] + distance[b, a] + distance[a, after_b]
+        delta = numpy.where(neighbours, next_value - current_value, delta)
+
+        # b and a are neighbours over the end: before_b -> b -> a -> after_a
+        over_end = (i == 0) & (j == size - 1)
+        current_value = \
+            distance[before_b, b] + distance[b, a] + distance[a, after_a]
+        next_value = \
+            distance[before_b, a] + distance[a, b] + distance[b, after_a]
+        delta = numpy.where(over_end, next_value - current_value, delta)
+
+        return delta
+
+
 # functions for array_swap
 
 def array_swap_changed_distances(size, move):
@@ -388,13 +617,20 @@ def array_reverse_order_transform_next_index_to_current_index(frm, to, move):
 
 # The method to return the other stuff.
 
+# maps the supported move types on a function that takes the evaluation
+# function and returns the delta-evaluation object
+_TSP_DELTA_CLASSES = {
+    'array_swap': TSPArraySwapDeltaEvaluate,
+    'array_reverse_order': partial(
+        TSPDeltaEvaluate,
+        changed_distances=array_reverse_order_changed_distances,
+        next_to_current=array_reverse_order_transform_next_index_to_current_index),
+}
+
+
 def delta_tsp(eval_func, move_func):
     """Returns delta-eval class for a TSP problem.
 
-    Note that if no methods for the problem can be found, that a placeholder
-    method will be used. The placeholder methods will raise a
-    NotImplementedError when called.
-
     Parameters
     ----------
     eval_func : AbstractEvaluationFunction
@@ -404,19 +640,23 @@ def delta_tsp(eval_func, move_func):
 
     Returns
     -------
-    TSPDeltaEvaluate
+    TSPDeltaEvaluate or TSPArraySwapDeltaEvaluate
         Class useable for delta evaluation of TSP problems.
 
+    Raises
+    ------
+    NotImplementedError
+        If there is no delta evaluation for the move type of move_func.
+
     """
 
     move_type = move_func.get_move_type()
 
-    if move_type is 'array_swap':
-        return TSPDeltaEvaluate(eval_func, array_swap_changed_distances,
-                                array_swap_transform_next_index_to_current_index)
-    if move_type is 'array_reverse_order':
-        return TSPDeltaEvaluate(eval_func,
-                                array_reverse_order_changed_distances,
-                                array_reverse_order_transform_next_index_to_current_index)
-    else:
-        raise NotImplementedError
+    try:
+        delta_class = _TSP_DELTA_CLASSES[move_type]
+    except KeyError:
+        raise NotImplementedError(
+            'No TSP delta evaluation for move type %r, supported move types '
+            'are %s.' % (move_type, list(_TSP_DELTA_CLASSES))) from None
+
+    return delta_class(eval_func)
@@ -1,6 +1,6 @@
 from lclpy.evaluation.abstract_evaluation_function \
     import AbstractEvaluationFunction
-from lclpy.evaluation.deltaeval.delta_eval_func import delta_eval_func
+import numpy
 
 
 class QuadraticAssignmentEvaluationFunction(AbstractEvaluationFunction):
@@ -17,7 +17,10 @@ class QuadraticAssignmentEvaluationFunction(AbstractEvaluationFunction):
     flow_matrix : numpy.ndarray
         The flow matrix for the problem. Should be symmetric.
     move_function : AbstractMove, optional
-        Only needs to be passed if one wishes to use delta evaluation.
+        Only needs to be passed if one wishes to use delta evaluation. It can
+        also be set later on with set_move_function. An ArrayProblem makes
+        its own delta evaluation object for its move function, so it isn't
+        needed when the evaluation function is used by an ArrayProblem.
 
     Attributes
     ----------
@@ -27,6 +30,15 @@ class QuadraticAssignmentEvaluationFunction(AbstractEvaluationFunction):
         The flow matrix of the problem.
     _size : int
         The amount of locations, derived from the distance matrix.
+    _rows : numpy.ndarray
+        The row indices of the upper triangle of the distance matrix, without
+        the diagonal.
+    _columns : numpy.ndarray
+        The column indices of the upper triangle of the distance matrix,
+        without the diagonal.
+    _upper_distances : numpy.ndarray
+        The distances of the upper triangle of the distance matrix, without
+        the diagonal, in the order of _rows and _columns.
 
     Examples
     --------
@@ -72,9 +84,12 @@ class QuadraticAssignmentEvaluationFunction(AbstractEvaluationFunction):
         self._distance_matrix = distance_matrix
         self._flow_matrix = flow_matrix
 
+        # every pair of locations is used once by evaluate
+        (self._rows, self._columns) = numpy.triu_indices(self._size, 1)
+        self._upper_distances = distance_matrix[self._rows, self._columns]
+
         if move_function is not None:
-            self._delta_evaluate_object = delta_eval_func(self, move_function)
-            self.delta_evaluate = self._delta_evaluate_object.delta_evaluate
+            self.set_move_function(move_function)
 
     def get_problem_type(self):
         """Returns the problem type.
@@ -93,7 +108,7 @@ class QuadraticAssignmentEvaluationFunction(AbstractEvaluationFunction):
 
         Parameters
         ----------
-        order : numpy.ndarray
+        order : numpy.ndarray or list
             A 1 dimensional array that maps facilities on locations. The
             index respresents a location, the corresponding value represents
             a facility.
@@ -105,15 +120,15 @@ class QuadraticAssignmentEvaluationFunction(AbstractEvaluationFunction):
 
         """
 
-        value = 0
+        # a list can't be indexed with the arrays of locations, for an
+        # ndarray this doesn't make a copy
+        order = numpy.asarray(order)
 
-        # all distances need to be checked once
-        for i in range(self._size):
-            for j in range(i + 1, self._size):
-                value += self._distance_matrix[i][j] * \
-                    self._flow_matrix[order[i]][order[j]]
+        # all distances need to be checked once, the flows between the
+        # facilities on every pair of locations are gathered at once
+        flows = self._flow_matrix[order[self._rows], order[self._columns]]
 
-        return value
+        return (self._upper_distances * flows).sum()
 
     def delta_evaluate(self, current_order, move):
         """Evaluates the difference in quality between two solutions.
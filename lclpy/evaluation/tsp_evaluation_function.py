@@ -1,6 +1,6 @@
 from lclpy.evaluation.abstract_evaluation_function \
     import AbstractEvaluationFunction
-from lclpy.evaluation.deltaeval.delta_eval_func import delta_eval_func
+import numpy
 
 
 class TspEvaluationFunction(AbstractEvaluationFunction):
@@ -16,7 +16,10 @@ class TspEvaluationFunction(AbstractEvaluationFunction):
         The distance matrix of the tsp-problem. The weight from A to B does
         not need to be equal to the weight from B to A.
     move_function : AbstractMove, optional
-        Only needs to be passed if one wishes to use delta evaluation.
+        Only needs to be passed if one wishes to use delta evaluation. It can
+        also be set later on with set_move_function. An ArrayProblem makes
+        its own delta evaluation object for its move function, so it isn't
+        needed when the evaluation function is used by an ArrayProblem.
 
     Attributes
     ----------
@@ -61,8 +64,7 @@ class TspEvaluationFunction(AbstractEvaluationFunction):
         self._size = distance_matrix.shape[0]
 
         if move_function is not None:
-            self._delta_evaluate_object = delta_eval_func(self, move_function)
-            self.delta_evaluate = self._delta_evaluate_object.delta_evaluate
+            self.set_move_function(move_function)
 
     def get_problem_type(self):
         """Returns the problem type.
@@ -92,16 +94,9 @@ class TspEvaluationFunction(AbstractEvaluationFunction):
             value, the better the quality.
         """
 
-        # init value
-        value = 0
-
-        # add all distances to value
-        for index in range(self._size - 1):
-            value += self._distance_matrix[order[index]][order[index + 1]]
-
-        value += self._distance_matrix[order[-1]][order[0]]
-
-        return value
+        # gather the distance from every point to the next point, the last
+        # point is followed by the first point, and sum them in one call
+        return self._distance_matrix[order, numpy.roll(order, -1)].sum()
 
     def delta_evaluate(self, current_order, move):
         """Calculates the difference in quality if the move would be performed.
@@ -1,9 +1,16 @@
 import csv
+import io
 import numpy
 import collections
 import os
 
 
+# the result types of read_csv are defined once on module level, this way
+# they don't need to be created for every call and the results can be pickled
+CsvData1 = collections.namedtuple('CsvData1', ['matrix_1'])
+CsvData2 = collections.namedtuple('CsvData2', ['matrix_1', 'matrix_2'])
+
+
 def read_csv(filename, dtype="int"):
     """Converts the csv file format to useable data structures.
 
@@ -15,11 +22,14 @@ def read_csv(filename, dtype="int"):
     ----------
     filename : str
         Absolute or relative path to the file that contains the data.
-    datatype : str, optional
+    dtype : str, optional
         Determines the data type of the returned matrix(es).
-        At the time, 2 datatypes are supported "float" and "int".
-        The default float and int are respectively used if one of this
-        parameter is used. The default is "int".
+        At the time, 4 datatypes are supported "float", "int", "float32" and
+        "int32". The default float and int are respectively used if "float"
+        or "int" is used. "float32" and "int32" halve the memory used by the
+        matrixes, but all values must fit in the smaller type, for "int32"
+        this means the values must lie in [-2**31, 2**31[.
+        The default is "int".
 
     Returns
     -------
@@ -29,6 +39,12 @@ def read_csv(filename, dtype="int"):
         A matrix for the problem, note that this matriw won't always be
         returned.
 
+    Raises
+    ------
+    ValueError
+        If dtype isn't "int", "float", "int32" or "float32" or if a value
+        doesn't fit in the chosen data type.
+
     Examples
     --------
     Read "testfile.csv" from the map "data" in the current directory:
@@ -40,36 +56,53 @@ def read_csv(filename, dtype="int"):
 
     """
 
-    if dtype is "int":
+    if dtype == "int":
         datatype = numpy.int_
-    elif dtype is "float":
+    elif dtype == "float":
         datatype = numpy.float_
+    elif dtype == "int32":
+        datatype = numpy.int32
+    elif dtype == "float32":
+        datatype = numpy.float32
+    else:
+        raise ValueError('The dtype "%s" isn\'t supported, use "int", '
+                         '"float", "int32" or "float32".' % dtype)
 
-    matrix_1 = []
-    matrix_2 = []
+    if numpy.issubdtype(datatype, numpy.integer):
+        limits = numpy.iinfo(datatype)
+    else:
+        limits = numpy.finfo(datatype)
 
-    current_matrix = matrix_1
+    with open(filename) as file:
+        text = file.read()
 
-    with open(filename, newline='') as file:
+    # the first empty line separates the matrixes, all following lines belong
+    # to the second matrix, loadtxt skips any other empty lines
+    blocks = [block for block in text.split('\n\n', 1) if block.strip()]
 
-        spamreader = csv.reader(file, quoting=csv.QUOTE_NONNUMERIC)
+    matrixes = []
 
-        for row in spamreader:
+    for block in blocks:
 
-            if len(row) == 0:
-                current_matrix = matrix_2
-                continue
+        # the values are parsed as floats, like the csv module does for
+        # unquoted values, so files with integral floats can be read as
+        # integers
+        matrix = numpy.loadtxt(io.StringIO(block), delimiter=',', ndmin=2)
 
-            current_matrix.append(row)
+        # values outside of the range of the data type would silently
+        # overflow when converted
+        if matrix.size > 0 and \
+                (matrix.min() < limits.min or matrix.max() > limits.max):
+            raise ValueError('The file "%s" contains values that don\'t fit '
+                             'in the dtype "%s".' % (filename, dtype))
 
-    if len(matrix_2) == 0:
-        CsvData = collections.namedtuple('CsvData', ['matrix_1'])
-        return CsvData(numpy.array(matrix_1, dtype=datatype))
+        matrixes.append(matrix.astype(datatype, copy=False))
+
+    if len(matrixes) == 1:
+        return CsvData1(matrixes[0])
 
     else:
-        CsvData = collections.namedtuple('CsvData', ['matrix_1', 'matrix_2'])
-        return CsvData(numpy.array(matrix_1, dtype=datatype),
-                       numpy.array(matrix_2, dtype=datatype))
+        return CsvData2(matrixes[0], matrixes[1])
 
 
 def write_csv(result, filename):
@@ -99,18 +132,10 @@ def write_csv(result, filename):
         if result[2] is not None:
 
             writer.writerow(("data", ))
-            data_size = len(result[2]._fields)
-            size = len(result[2][0])
             writer.writerow(result[2]._fields)
 
-            for i in range(size):
-
-                data_row = []
-
-                for j in range(data_size):
-                    data_row.append(result[2][j][i])
-
-                writer.writerow(data_row)
+            # the data is stored per column, zip turns it into rows
+            writer.writerows(zip(*result[2]))
 
 
 def write_benchmark_csv(benchmark_result, pathname,
@@ -182,7 +182,7 @@ def _att(from_x, from_y, to_x, to_y):
     return tij
 
 
-def _default_processing(data, dist_func, type=numpy.float_):
+def _default_processing(data, dist_func, type=numpy.float64):
     """Creates a dict and calculates the distance matrix for a 2D tsp problem.
 
     Parameters
@@ -196,7 +196,7 @@ def _default_processing(data, dist_func, type=numpy.float_):
         function's arguments must be the x and y coordinates of the first
         point, followed by the x and y coordinates of the second point.
     type : numpy.dtype, optional
-        The data type used by the numpy array. The default is numpy.float_,
+        The data type used by the numpy array. The default is numpy.float64,
         which is the default datatype when creating a numpy.ndarray.
 
     Returns
@@ -214,13 +214,12 @@ def _default_processing(data, dist_func, type=numpy.float_):
     size = len(data)
 
     # dist_matrix [from] [to]
-    dist_matrix = numpy.full((size, size), numpy.inf, dtype=type)
+    # the matrix is created with the final dtype, the distance between a
+    # point and itself is always zero.
+    dist_matrix = numpy.zeros((size, size), dtype=type)
 
     for i in range(size):
 
-        # ditance between a point and itself is always zero.
-        dist_matrix[i][i] = 0
-
         # get coordinates point
         i_dist_x = data[i][1]
         i_dist_y = data[i][2]
@@ -230,11 +229,11 @@ def _default_processing(data, dist_func, type=numpy.float_):
             j_dist_x = data[j][1]
             j_dist_y = data[j][2]
 
-            # calculate distance
-            dist_matrix[i][j] = dist_func(
-                i_dist_x, i_dist_y, j_dist_x, j_dist_y)
-            dist_matrix[j][i] = dist_func(
-                i_dist_x, i_dist_y, j_dist_x, j_dist_y)
+            # calculate distance, the distance is symmetric, so it only
+            # needs to be calculated once
+            distance = dist_func(i_dist_x, i_dist_y, j_dist_x, j_dist_y)
+            dist_matrix[i, j] = distance
+            dist_matrix[j, i] = distance
 
     return dist_matrix
 
@@ -27,6 +27,10 @@ to the evaluation function:
 Note that the evaluation function might have less or more parameters than in
 this example.
 
+ArrayProblem makes its own delta evaluation object for its move function, so
+this step can be skipped when an ArrayProblem is used. This also allows one
+evaluation function to be shared by problems with different move functions.
+
 You can find information how to implement your own delta evaluation in the
 docstring of lclpy.evaluation.deltaeval.__init__ or in the documentation of
 lclpy.evaluation.deltaeval.
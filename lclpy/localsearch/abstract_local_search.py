@@ -9,6 +9,8 @@ class AbstractLocalSearch(ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
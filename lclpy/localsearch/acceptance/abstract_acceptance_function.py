@@ -9,6 +9,8 @@ class AbstractAcceptanceFunction(ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -32,3 +34,12 @@ class AbstractAcceptanceFunction(ABC):
 
         """
         pass
+
+    def reset(self):
+        """Resets the object back to it's state after init.
+
+        Acceptance functions without a state don't need to override this
+        method.
+
+        """
+        pass
@@ -2,6 +2,7 @@ from lclpy.localsearch.acceptance.abstract_acceptance_function \
     import AbstractAcceptanceFunction
 import random
 import math
+import numpy
 
 
 class SimulatedAnnealingAcceptanceFunction(AbstractAcceptanceFunction):
@@ -24,6 +25,16 @@ class SimulatedAnnealingAcceptanceFunction(AbstractAcceptanceFunction):
         decrease the odds of values being accepted. While it is possible to use
         a multiplier greater than 1, this might cause weird behaviour.
         The default value is 1.
+    rng : None, int or numpy.random.Generator, optional
+        If None, the random numbers are drawn from the random module. If an
+        int or a numpy Generator is given, the random numbers are drawn in
+        batches from a numpy Generator. An int is used as the seed of a new
+        Generator. The Generator is reseeded from the random module by
+        reset, so after a reset random.seed determines the random numbers,
+        just like it does when rng is None. The default is None.
+    buffer_size : int, optional
+        The amount of random numbers that are drawn at once when rng isn't
+        None. The default is 65536.
 
     Attributes
     ----------
@@ -31,6 +42,18 @@ class SimulatedAnnealingAcceptanceFunction(AbstractAcceptanceFunction):
         The delta_value will be multiplied by this multiplier.
     _multiplier : int or float
         Is multiplied with the whole probability.
+    _random
+        Function without parameters that returns a random number in the
+        interval [0, 1[.
+    _rng : numpy.random.Generator
+        The Generator used to draw the batches of random numbers. Only
+        exists if rng isn't None.
+    _buffer_size : int
+        The amount of random numbers in a batch. Only exists if rng isn't
+        None.
+    _draws : iterator
+        Iterator over the remaining random numbers of the current batch. Only
+        exists if rng isn't None.
 
     Examples
     --------
@@ -61,14 +84,132 @@ class SimulatedAnnealingAcceptanceFunction(AbstractAcceptanceFunction):
         >>> test.accept(200, 1000)
         False
 
+    Drawing the random numbers in batches from a seeded numpy Generator:
+
+    .. doctest::
+
+        >>> from lclpy.localsearch.acceptance.simulated_annealing_acceptance_function \\
+        ...     import SimulatedAnnealingAcceptanceFunction
+        ... # init, 0 is used as the seed of the Generator
+        >>> test = SimulatedAnnealingAcceptanceFunction(rng=0)
+        ... # tests
+        >>> test.accept(400, 1000)
+        True
+        >>> test.accept(400, 1000)
+        True
+        >>> test.accept(400, 1000)
+        True
+        >>> test.accept(400, 1000)
+        True
+        >>> test.accept(400, 1000)
+        False
+
+    After a reset, the Generator is reseeded from the random module, so
+    random.seed makes the drawn numbers reproducible:
+
+    .. doctest::
+
+        >>> import random
+        >>> from lclpy.localsearch.acceptance.simulated_annealing_acceptance_function \\
+        ...     import SimulatedAnnealingAcceptanceFunction
+        >>> test = SimulatedAnnealingAcceptanceFunction(rng=0)
+        ... # first run
+        >>> random.seed(3)
+        >>> test.reset()
+        >>> first = [test.accept(400, 1000) for i in range(10)]
+        ... # second run with the same seed
+        >>> random.seed(3)
+        >>> test.reset()
+        >>> second = [test.accept(400, 1000) for i in range(10)]
+        >>> first == second
+        True
+
     """
 
-    def __init__(self, diff_multiplier=1, multiplier=1):
+    def __init__(self, diff_multiplier=1, multiplier=1, rng=None,
+                 buffer_size=65536):
         super().__init__()
 
         self._diff_multiplier = diff_multiplier
         self._multiplier = multiplier
 
+        if rng is None:
+            self._random = random.random
+        else:
+            self._rng = numpy.random.default_rng(rng)
+            self._buffer_size = buffer_size
+            self._draws = iter(())
+            self._random = self._draw_from_buffer
+
+    def __getstate__(self):
+        """Returns the state used to pickle the object.
+
+        random.random is bound to the random module of the current process,
+        it's rebound after unpickling, so the unpickled object uses the
+        random module of the process it's unpickled in.
+
+        Returns
+        -------
+        dict
+            The attributes of the object.
+
+        """
+
+        state = self.__dict__.copy()
+
+        if state['_random'] is random.random:
+            state['_random'] = None
+
+        return state
+
+    def __setstate__(self, state):
+        """Restores the object from the state made by __getstate__.
+
+        Parameters
+        ----------
+        state : dict
+            The attributes of the object.
+
+        """
+
+        self.__dict__.update(state)
+
+        if self._random is None:
+            self._random = random.random
+
+    def reset(self):
+        """Resets the object back to it's state after init.
+
+        If the random numbers are drawn from a numpy Generator, a new
+        Generator is seeded with a number drawn from the random module and
+        the remaining numbers of the current batch are discarded. This way
+        random.seed determines the random numbers after a reset, in every
+        process, just like it does when rng is None.
+
+        """
+
+        if self._random is not random.random:
+            self._rng = numpy.random.default_rng(random.getrandbits(64))
+            self._draws = iter(())
+
+    def _draw_from_buffer(self):
+        """Returns the next random number of the current batch.
+
+        A new batch is drawn from _rng when the current batch is exhausted.
+
+        Returns
+        -------
+        float
+            A random number in the interval [0, 1[.
+
+        """
+
+        try:
+            return next(self._draws)
+        except StopIteration:
+            self._draws = iter(self._rng.random(self._buffer_size).tolist())
+            return next(self._draws)
+
     def accept(self, delta_value, temperature):
         """Function to reject or accept certain potential solutions.
 
@@ -107,6 +248,6 @@ class SimulatedAnnealingAcceptanceFunction(AbstractAcceptanceFunction):
             math.exp(-(self._diff_multiplier * delta_value) / temperature)
 
         # generates a random number in the interval [0, 1[
-        random_number = random.random()
+        random_number = self._random()
 
         return probability > random_number
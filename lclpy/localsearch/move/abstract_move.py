@@ -9,6 +9,8 @@ class AbstractMove(ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(AbstractMove, self).__init__()
 
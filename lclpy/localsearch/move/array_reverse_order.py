@@ -1,3 +1,4 @@
+import itertools
 import random
 from lclpy.localsearch.move.abstract_move \
     import AbstractMove
@@ -82,6 +83,8 @@ class ArrayReverseOrder(AbstractMove):
 
     """
 
+    __slots__ = ('_size',)
+
     def __init__(self, size):
         super().__init__()
         self._size = size
@@ -113,17 +116,10 @@ class ArrayReverseOrder(AbstractMove):
 
         (index_1, index_2) = move
 
-        # calulate the mean of index_1 and index_2
-        middle = (index_1 + index_2) / 2
-
-        # swap all pairs in the range [index_1, index_2].
-        # This will change the order of the values in the range.
-        while(index_1 < middle):
-
-            array[index_1], array[index_2] = array[index_2], array[index_1]
-
-            index_1 += 1
-            index_2 -= 1
+        # reverse the order of the values in the range [index_1, index_2].
+        # numpy detects that the reversed view overlaps with the target, so
+        # the reversal is done with a temporary copy in a single operation.
+        array[index_1:index_2 + 1] = array[index_1:index_2 + 1][::-1]
 
     def undo_move(self, array, move):
         """Undoes the move asked.
@@ -138,21 +134,25 @@ class ArrayReverseOrder(AbstractMove):
 
         """
 
-        self.move(array, move)
+        # reversing is its own inverse, it's performed here directly to avoid
+        # the extra call to move
+        (index_1, index_2) = move
+
+        array[index_1:index_2 + 1] = array[index_1:index_2 + 1][::-1]
 
     def get_moves(self):
         """Iterate over all valid moves.
 
-        Yields
-        ------
-        tuple of int
-            The next valid move.
+        Returns
+        -------
+        iterator of tuple of int
+            Returns every valid move once, ordered on the first index and
+            then on the second index.
 
         """
 
-        for i in range(self._size):
-            for j in range(i + 1, self._size):
-                yield (i, j)
+        # combinations generates the (i, j) pairs with i < j in C
+        return itertools.combinations(range(self._size), 2)
 
     def get_random_move(self):
         """This method is used to generate one random move.
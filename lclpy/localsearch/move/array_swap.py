@@ -1,3 +1,4 @@
+import itertools
 import random
 from lclpy.localsearch.move.abstract_move \
     import AbstractMove
@@ -79,6 +80,8 @@ class ArraySwap(AbstractMove):
 
     """
 
+    __slots__ = ('_size',)
+
     def __init__(self, size):
         super().__init__()
 
@@ -126,21 +129,25 @@ class ArraySwap(AbstractMove):
 
         """
 
-        self.move(array, move)
+        # a swap is its own inverse, it's performed here directly to avoid
+        # the extra call to move
+        (index_1, index_2) = move
+
+        array[index_1], array[index_2] = array[index_2], array[index_1]
 
     def get_moves(self):
         """Iterate over all valid moves.
 
-        Yields
-        ------
-        tuple of int
-            The next valid move.
+        Returns
+        -------
+        iterator of tuple of int
+            Returns every valid move once, ordered on the first index and
+            then on the second index.
 
         """
 
-        for i in range(self._size):
-            for j in range(i + 1, self._size):
-                yield (i, j)
+        # combinations generates the (i, j) pairs with i < j in C
+        return itertools.combinations(range(self._size), 2)
 
     def get_random_move(self):
         """This method is used to generate one random move.
@@ -30,6 +30,10 @@ class MultiNeighbourhood(AbstractMove):
     ----------
     _move_func_list : tuple of AbstractMove
         Contains all used move functions.
+    _moves : tuple
+        The bound move methods of the move functions in _move_func_list.
+    _undo_moves : tuple
+        The bound undo_move methods of the move functions in _move_func_list.
     _size : int
         The size of _move_func_list.
     _tresholds : tuple of float
@@ -230,12 +234,20 @@ class MultiNeighbourhood(AbstractMove):
 
     """
 
+    __slots__ = ('_move_func_list', '_moves', '_undo_moves', '_size',
+                 '_tresholds')
+
     def __init__(self, move_func_list, weights=None):
         super().__init__()
 
         # init
         self._move_func_list = tuple(move_func_list)
 
+        self._moves = tuple(
+            move_func.move for move_func in self._move_func_list)
+        self._undo_moves = tuple(
+            move_func.undo_move for move_func in self._move_func_list)
+
         self._size = len(move_func_list)
 
         if weights is None:
@@ -282,7 +294,7 @@ class MultiNeighbourhood(AbstractMove):
         """
 
         # pick the right move_function and perform the move
-        self._move_func_list[move[0]].move(data, move[1])
+        self._moves[move[0]](data, move[1])
 
     def undo_move(self, data, move):
         """Undoes a move.
@@ -300,7 +312,7 @@ class MultiNeighbourhood(AbstractMove):
         """
 
         # pick the right move_function and undo the move
-        self._move_func_list[move[0]].undo_move(data, move[1])
+        self._undo_moves[move[0]](data, move[1])
 
     def get_moves(self):
         """A generator used to return all valid moves in the neighbourhood.
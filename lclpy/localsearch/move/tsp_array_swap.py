@@ -1,4 +1,5 @@
 from lclpy.localsearch.move.array_swap import ArraySwap
+import itertools
 import random
 
 
@@ -82,25 +83,27 @@ class TspArraySwap(ArraySwap):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, size):
         super().__init__(size)
 
     def get_moves(self):
-        """This is a generator used to return all valid moves.
+        """Returns an iterator over all valid moves.
 
         Note that the swaps with the first position aren't included. When
         solving TSP problems, the start position doesn't matter.
 
-        Yields
-        ------
-        tuple of int
-            The next valid move.
+        Returns
+        -------
+        iterator of tuple of int
+            Returns every valid move once, ordered on the first index and
+            then on the second index.
 
         """
 
-        for i in range(1, self._size):
-            for j in range(i + 1, self._size):
-                yield (i, j)
+        # combinations generates the (i, j) pairs with i < j in C
+        return itertools.combinations(range(1, self._size), 2)
 
     def get_random_move(self):
         """This method is used to generate one random move.
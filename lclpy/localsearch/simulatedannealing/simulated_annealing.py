@@ -13,6 +13,13 @@ from lclpy.aidfunc.logging import log_improvement
 from collections import namedtuple
 
 
+# the result types are defined once on module level, this way they don't need
+# to be created for every run and the results can be pickled
+Data = namedtuple('Data', ['time', 'iteration', 'temperature', 'value',
+                           'best_value'])
+Results = namedtuple('Results', ['best_order', 'best_value', 'data'])
+
+
 class SimulatedAnnealing(AbstractLocalSearch):
     """Performs a simulated annealing algorithm with the given parameters.
 
@@ -39,6 +46,11 @@ class SimulatedAnnealing(AbstractLocalSearch):
     logging: bool, optional
         Improvements and passed worse solutions will be logged to the command
         line if this variable is True. Default is True.
+    rng : None, int or numpy.random.Generator, optional
+        Passed to the acceptance function. If None, the acceptance function
+        uses the random module. If an int or a numpy Generator is given, the
+        acceptance function draws its random numbers in batches from a numpy
+        Generator. The default is None.
 
     Attributes
     ----------
@@ -171,7 +183,7 @@ class SimulatedAnnealing(AbstractLocalSearch):
     def __init__(self, problem, termination_criterion,
                  cooling_function, iterations_for_temp_f,
                  start_temperature=2000, minimise=True,
-                 benchmarking=False, logging=True):
+                 benchmarking=False, logging=True, rng=None):
 
         super().__init__()
 
@@ -181,17 +193,18 @@ class SimulatedAnnealing(AbstractLocalSearch):
         self._iterations_for_temp_f = iterations_for_temp_f
         self._start_temperature = start_temperature
         self._temperature = start_temperature
-        self._acceptance_function = SimulatedAnnealingAcceptanceFunction()
 
         if minimise:
             self._is_improvement = smaller_or_equal
             self._is_better = smaller
-            self._acceptance_function = SimulatedAnnealingAcceptanceFunction()
+            self._acceptance_function = \
+                SimulatedAnnealingAcceptanceFunction(rng=rng)
         else:
             self._is_improvement = bigger_or_equal
             self._is_better = bigger
             self._acceptance_function = \
-                SimulatedAnnealingAcceptanceFunction(diff_multiplier=-1)
+                SimulatedAnnealingAcceptanceFunction(diff_multiplier=-1,
+                                                     rng=rng)
 
         if benchmarking:
             self.data = []
@@ -237,8 +250,17 @@ class SimulatedAnnealing(AbstractLocalSearch):
         self._termination_criterion.check_first_value(base_value)
         self._termination_criterion.start_timing()
 
+        # bind the methods used in the main loop to local names, this avoids
+        # an attribute lookup for every call
+        keep_running = self._termination_criterion.keep_running
+        step = self._termination_criterion.step
+        check_new_value = self._termination_criterion.check_new_value
+        get_random_move = self._problem.get_random_move
+        evaluate_move = self._problem.evaluate_move
+        perform_move = self._problem.move
+
         # main loop
-        while self._termination_criterion.keep_running():
+        while keep_running():
 
             # performs iterations at the current temperature
             #
@@ -248,18 +270,15 @@ class SimulatedAnnealing(AbstractLocalSearch):
                     self._iterations_for_temp_f.get_iterations(
                         self._temperature)):
 
-                if not self._termination_criterion.keep_running():
-                    break
-
                 # get and evaluate move
-                move = self._problem.get_random_move()
-                delta = self._problem.evaluate_move(move)
+                move = get_random_move()
+                delta = evaluate_move(move)
 
                 # accept or reject move
                 if self._is_improvement(0, delta):
 
                     # better than the current state --> accept
-                    self._problem.move(move)
+                    perform_move(move)
                     base_value = base_value + delta
 
                     # check if best state
@@ -270,7 +289,7 @@ class SimulatedAnnealing(AbstractLocalSearch):
                         self._log_improvement(base_value)
 
                     # let termination criterion check the new value
-                    self._termination_criterion.check_new_value(base_value)
+                    check_new_value(base_value)
 
                     # add to data
                     self._data_append(self.data, iteration, self._temperature,
@@ -282,11 +301,11 @@ class SimulatedAnnealing(AbstractLocalSearch):
                     # worse than current state --> use acceptance function.
                     if self._acceptance_function.accept(
                             delta, self._temperature):
-                        self._problem.move(move)
+                        perform_move(move)
                         base_value = base_value + delta
 
                         # let termination criterion check the new value
-                        self._termination_criterion.check_new_value(base_value)
+                        check_new_value(base_value)
 
                         # add to data
                         self._data_append(self.data, iteration,
@@ -295,7 +314,12 @@ class SimulatedAnnealing(AbstractLocalSearch):
                                           self._problem.best_order_value)
 
                 iteration += 1
-                self._termination_criterion.iteration_done()
+
+                # finish the iteration and check the termination criterion in
+                # a single call, the while loop already checked it before the
+                # first iteration at this temperature
+                if not step():
+                    break
 
             # lowers the current temperature
             self._temperature = self._cooling_function.next_temperature(
@@ -315,21 +339,14 @@ class SimulatedAnnealing(AbstractLocalSearch):
             data = convert_data(self.data)
 
             # make namedtuple
-            DataAsLists = namedtuple(
-                'Data',
-                ['time', 'iteration',
-                 'temperature', 'value', 'best_value'])
-
-            data = DataAsLists(data[0], data[1], data[2], data[3], data[4])
+            data = Data(data[0], data[1], data[2], data[3], data[4])
 
         else:
             data = None
 
-        # return results
-
-        Results = namedtuple('Results', ['best_order', 'best_value', 'data'])
-
-        return Results(self._problem.best_order,
+        # return results, the problem overwrites best_order in later runs,
+        # the results get a copy so they aren't altered
+        return Results(self._problem.best_order.copy(),
                        self._problem.best_order_value,
                        data)
 
@@ -425,6 +442,7 @@ class SimulatedAnnealing(AbstractLocalSearch):
         self._temperature = self._start_temperature
         self._problem.reset()
         self._termination_criterion.reset()
+        self._acceptance_function.reset()
 
         if self.data is not None:
             self.data = []
@@ -10,6 +10,12 @@ from lclpy.aidfunc.logging import log_improvement
 from collections import namedtuple
 
 
+# the result types are defined once on module level, this way they don't need
+# to be created for every run and the results can be pickled
+Data = namedtuple('Data', ['time', 'iteration', 'value'])
+Results = namedtuple('Results', ['best_order', 'best_value', 'data'])
+
+
 class SteepestDescent(AbstractLocalSearch):
     """Performs a steepest descent algorithm on the given problem.
 
@@ -39,9 +45,8 @@ class SteepestDescent(AbstractLocalSearch):
     _function
         The function used to determine if a delta value is better than another
         delta value.
-    _best_found_delta_base_value : float
-        Initialisation value for the delta value of each iteration. It's
-        infinite when minimising or minus infinite when maximising.
+    _minimise : bool
+        True when minimising, False when maximising.
     data : list of tuple
         Data useable for benchmarking will be None if no benchmarks are made.
     _data_append
@@ -107,6 +112,40 @@ class SteepestDescent(AbstractLocalSearch):
         >>> steepest_descent.run()
         Results(best_order=array([0, 1, 3, 2]), best_value=21, data=None)
 
+    Every result has its own best_order, so the problem can be altered and
+    run again without altering the results of earlier runs:
+
+    .. doctest::
+
+        >>> import numpy
+        >>> from lclpy.localsearch.steepestdescent.steepest_descent \\
+        ...     import SteepestDescent
+        >>> from lclpy.localsearch.move.tsp_array_swap import TspArraySwap
+        >>> from lclpy.evaluation.tsp_evaluation_function \\
+        ...     import TspEvaluationFunction
+        >>> from lclpy.problem.array_problem import ArrayProblem
+        ... # init problem
+        >>> distance_matrix = numpy.array(
+        ... [[0, 2, 5, 8],
+        ...  [2, 0, 4, 1],
+        ...  [5, 4, 0, 7],
+        ...  [8, 1, 7, 0]])
+        >>> size = distance_matrix.shape[0]
+        >>> move = TspArraySwap(size)
+        >>> evaluation = TspEvaluationFunction(distance_matrix, move)
+        >>> problem = ArrayProblem(evaluation, move, size)
+        ... # init SteepestDescent
+        >>> steepest_descent = SteepestDescent(problem, logging=False)
+        ... # run algorithm
+        >>> result = steepest_descent.run()
+        ... # alter the best order of the problem
+        >>> problem.move((1, 2))
+        >>> problem.set_as_best(problem.evaluate())
+        ... # the result isn't altered
+        >>> result.best_order
+        array([0, 1, 3, 2])
+        >>> problem.best_order
+        array([0, 3, 1, 2])
 
 
     """
@@ -122,12 +161,12 @@ class SteepestDescent(AbstractLocalSearch):
         else:
             self._termination_criterion = termination_criterion
 
+        self._minimise = minimise
+
         if minimise:
             self._function = smaller
-            self._best_found_delta_base_value = float("inf")
         else:
             self._function = bigger
-            self._best_found_delta_base_value = float("-inf")
 
         if benchmarking:
             self.data = []
@@ -173,21 +212,14 @@ class SteepestDescent(AbstractLocalSearch):
         self._termination_criterion.check_first_value(base_value)
         self._termination_criterion.start_timing()
 
-        while self._termination_criterion.keep_running():
+        # step() finishes an iteration and checks the termination criterion
+        # in a single call, so only the first check uses keep_running()
+        running = self._termination_criterion.keep_running()
+        while running:
 
             # search the neighbourhood for the best move
-            best_found_delta = self._best_found_delta_base_value
-            best_found_move = None
-
-            for move in self._problem.get_moves():
-
-                # check quality move
-                delta = self._problem.evaluate_move(move)
-
-                # keep data best move
-                if self._function(best_found_delta, delta):
-                    best_found_delta = delta
-                    best_found_move = move
+            (best_found_move, best_found_delta) = \
+                self._problem.best_move(self._minimise)
 
             # check if the best_found_move improves the delta, if this is the
             # case perform the move and set a new best problem
@@ -214,7 +246,7 @@ class SteepestDescent(AbstractLocalSearch):
                 break
 
             iteration += 1
-            self._termination_criterion.iteration_done()
+            running = self._termination_criterion.step()
 
         # last data point
         self._data_append(self.data, iteration, base_value)
@@ -227,18 +259,14 @@ class SteepestDescent(AbstractLocalSearch):
             data = convert_data(self.data)
 
             # make namedtuple
-            DataAsLists = namedtuple('Data', ['time', 'iteration', 'value'])
-
-            data = DataAsLists(data[0], data[1], data[2])
+            data = Data(data[0], data[1], data[2])
 
         else:
             data = None
 
-        # return results
-
-        Results = namedtuple('Results', ['best_order', 'best_value', 'data'])
-
-        return Results(self._problem.best_order,
+        # return results, the problem overwrites best_order in later runs,
+        # the results get a copy so they aren't altered
+        return Results(self._problem.best_order.copy(),
                        self._problem.best_order_value,
                        data)
 
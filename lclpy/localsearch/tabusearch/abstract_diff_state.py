@@ -10,6 +10,8 @@ class AbstractDiffState(ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -11,6 +11,12 @@ from lclpy.localsearch.tabusearch.tabu_list import TabuList
 from collections import namedtuple
 
 
+# the result types are defined once on module level, this way they don't need
+# to be created for every run and the results can be pickled
+Data = namedtuple('Data', ['time', 'iteration', 'value', 'best_value'])
+Results = namedtuple('Results', ['best_order', 'best_value', 'data'])
+
+
 class TabuSearch(AbstractLocalSearch):
     """Performs a tabu search on the given problem.
 
@@ -211,7 +217,10 @@ class TabuSearch(AbstractLocalSearch):
         self._termination_criterion.start_timing()
 
         # main loop
-        while self._termination_criterion.keep_running():
+        # step() finishes an iteration and checks the termination criterion
+        # in a single call, so only the first check uses keep_running()
+        running = self._termination_criterion.keep_running()
+        while running:
 
             # search the neighbourhood for the best move
             best_found_delta = self._best_found_delta_base_value
@@ -268,7 +277,7 @@ class TabuSearch(AbstractLocalSearch):
                 break
 
             iteration += 1
-            self._termination_criterion.iteration_done()
+            running = self._termination_criterion.step()
 
         # last data point
         self._data_append(self.data, iteration, base_value,
@@ -282,19 +291,14 @@ class TabuSearch(AbstractLocalSearch):
             data = convert_data(self.data)
 
             # make namedtuple
-            DataAsLists = namedtuple(
-                'Data', ['time', 'iteration', 'value', 'best_value'])
-
-            data = DataAsLists(data[0], data[1], data[2], data[3])
+            data = Data(data[0], data[1], data[2], data[3])
 
         else:
             data = None
 
-        # return results
-
-        Results = namedtuple('Results', ['best_order', 'best_value', 'data'])
-
-        return Results(self._problem.best_order,
+        # return results, the problem overwrites best_order in later runs,
+        # the results get a copy so they aren't altered
+        return Results(self._problem.best_order.copy(),
                        self._problem.best_order_value,
                        data)
 
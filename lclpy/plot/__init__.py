@@ -1,3 +1,6 @@
 """Contains functions to plot the results of localsearch algorithms.
 
+The functions need matplotlib, which can be installed together with lclpy
+by using "pip install lclpy[plot]".
+
 """
@@ -1,6 +1,3 @@
-import matplotlib.pyplot as plt
-
-
 def plot(data, title='Time - evaluation value plot.', width=20, height=10):
     """Plots the data in a time-value plot.
 
@@ -18,6 +15,10 @@ def plot(data, title='Time - evaluation value plot.', width=20, height=10):
 
     """
 
+    # matplotlib is an optional dependency, it's only imported when a plot
+    # is made
+    import matplotlib.pyplot as plt
+
     # get the data from the data object
     time = data.time
     values = data.value
@@ -58,6 +59,10 @@ def iterations_plot(data, title='Iterations - evaluation value plot.',
 
     """
 
+    # matplotlib is an optional dependency, it's only imported when a plot
+    # is made
+    import matplotlib.pyplot as plt
+
     # get the data from the data object
     iterations = data.iteration
     values = data.value
@@ -106,6 +111,10 @@ def plot_single_stat(benchmark_single_stat, title='Single stat table',
 
     """
 
+    # matplotlib is an optional dependency, it's only imported when a plot
+    # is made
+    import matplotlib.pyplot as plt
+
     if algorithm_names is None:
         algorithm_names = tuple(range(len(benchmark_single_stat)))
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from lclpy.aidfunc.is_improvement_func import bigger, smaller
 
 
 class AbstractLocalSearchProblem(ABC):
@@ -10,6 +11,8 @@ class AbstractLocalSearchProblem(ABC):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -52,6 +55,50 @@ class AbstractLocalSearchProblem(ABC):
 
         pass
 
+    def best_move(self, minimise=True):
+        """Searches the complete neighbourhood for the best move.
+
+        Every move of get_moves is evaluated with evaluate_move. If several
+        moves are equally good, the first one is returned. Subclasses can
+        override this method with a faster search.
+
+        Parameters
+        ----------
+        minimise : bool, optional
+            True if a smaller delta value is better, False if a bigger delta
+            value is better. The default is True.
+
+        Returns
+        -------
+        move : tuple of int or None
+            The best move. None if the neighbourhood contains no moves.
+        delta : int or float
+            The delta value of the best move. If the neighbourhood contains no
+            moves, it is infinite when minimising and minus infinite when
+            maximising.
+
+        """
+
+        if minimise:
+            is_better = smaller
+            best_delta = float("inf")
+        else:
+            is_better = bigger
+            best_delta = float("-inf")
+
+        best_found_move = None
+        evaluate_move = self.evaluate_move
+
+        for move in self.get_moves():
+
+            delta = evaluate_move(move)
+
+            if is_better(best_delta, delta):
+                best_delta = delta
+                best_found_move = move
+
+        return (best_found_move, best_delta)
+
     @abstractmethod
     def get_random_move(self):
         """A function to return a random move from the complete neighbourhood.
@@ -98,8 +145,15 @@ class AbstractLocalSearchProblem(ABC):
         pass
 
     @abstractmethod
-    def set_as_best(self):
-        """Saves the current state as the best found state."""
+    def set_as_best(self, evaluation_value):
+        """Saves the current state as the best found state.
+
+        Parameters
+        ----------
+        evaluation_value : int or float
+            The evaluation value of the current state.
+
+        """
 
         pass
 
@@ -116,6 +170,22 @@ class AbstractLocalSearchProblem(ABC):
 
         pass
 
+    def fingerprint(self):
+        """Returns a cheap hashable key that describes the current state.
+
+        Two states have an equal fingerprint if and only if they are equal.
+        The default implementation returns the state, problems can override
+        it with a representation that is cheaper to create and to hash.
+
+        Returns
+        -------
+        hashable
+            A key associated with the current state.
+
+        """
+
+        return self.state()
+
     def first_neighbourhood(self):
         """Changes the current neighbourhood to the first neighbourhood.
 
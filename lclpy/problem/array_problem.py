@@ -1,10 +1,11 @@
 from lclpy.problem.abstract_local_search_problem \
     import AbstractLocalSearchProblem
 import numpy
+from numpy import copyto
+from collections import OrderedDict
 from lclpy.aidfunc.error_func import not_multi_move_type
 from lclpy.aidfunc.error_func import NoNextNeighbourhood
-
-from statistics import mean, StatisticsError
+from lclpy.evaluation.deltaeval.delta_eval_func import delta_eval_func
 
 
 class ArrayProblem(AbstractLocalSearchProblem):
@@ -13,7 +14,13 @@ class ArrayProblem(AbstractLocalSearchProblem):
     Parameters
     ----------
     evaluation_function : AbstractEvaluationFunction
-        The evaluation function that needs to be used for the problem.
+        The evaluation function that needs to be used for the problem. It
+        isn't altered, the problem makes its own delta evaluation object for
+        move_function. If delta evaluation is implemented for the combination
+        of evaluation_function and move_function, this built-in delta
+        evaluation is used instead of evaluation_function.delta_evaluate,
+        even if delta_evaluate was overridden. Else
+        evaluation_function.delta_evaluate is used.
     move_function : AbstractMove
         The move function that needs to be used for the problem.
     order : numpy.ndarray or list, optional
@@ -23,6 +30,18 @@ class ArrayProblem(AbstractLocalSearchProblem):
         The default value is None.
         In the default case a numpy array will be generated. The generated
         array's values will always be ordered from small to big.
+    evaluation_cache_size : int, optional
+        The maximal amount of orders of which the evaluation value is
+        remembered by evaluate. When the cache is full, the least recently
+        used entry is discarded. The cache is kept after a reset, which makes
+        it useful for algorithms that are restarted or that often return to
+        the same orders. The default is 0, which disables the cache.
+    dtype : numpy.dtype, optional
+        The integer data type of _order. A smaller type, like numpy.int32 or
+        numpy.int16, halves or quarters the memory used by the order, which
+        makes reading and copying it faster for large problems. Every value
+        in the interval [0,size[ must fit in the type. The default is None,
+        which uses the default integer type of numpy.
 
     Attributes
     ----------
@@ -36,9 +55,41 @@ class ArrayProblem(AbstractLocalSearchProblem):
     _starting_order : numpy.ndarray
         The initial value of _order.
     best_order : numpy.ndarray
-        Contains the order of the best found problem.
-    best_order_value: int or float
-        The evaluation value of the best found problem.
+        Contains the order of the best found problem. The same array is
+        overwritten by set_as_best, a new array is only created by reset.
+        Before set_as_best is called, it contains the starting order. The
+        localsearch algorithms return a copy of it in their results.
+    best_order_value: int or float or None
+        The evaluation value of the best found problem. None if set_as_best
+        wasn't called yet.
+    _evaluation_cache_size : int
+        The maximal amount of entries in _evaluation_cache.
+    _evaluation_cache : collections.OrderedDict
+        Maps the bytes of an order on the evaluation value of that order.
+        The least recently used entry is the first entry.
+    _move, _undo_move
+        The bound move and undo_move methods of _move_function.
+    _evaluate
+        The bound evaluate method of _evaluation_function.
+    _delta_evaluate
+        The bound delta_evaluate method of the delta evaluation object that is
+        made for _move_function. If there is no delta evaluation for the
+        combination of _evaluation_function and _move_function, the
+        delta_evaluate method of _evaluation_function itself is used.
+    _delta_evaluate_all
+        The delta_evaluate_all method of the delta evaluation object, None if
+        it has no such method.
+    _moves_array : numpy.ndarray or None
+        All moves of get_moves as rows of a 2 dimensional array. Is created
+        the first time it's needed by evaluate_all_moves.
+    _is_multi_neighbourhood : bool
+        True if move_function is a MultiNeighbourhood.
+    current_neighbourhood : int
+        The index of the current neighbourhood. Only exists if move_function
+        is a MultiNeighbourhood.
+    neighbourhood_size : int
+        The amount of neighbourhoods. Only exists if move_function is a
+        MultiNeighbourhood.
 
     Examples
     --------
@@ -134,32 +185,146 @@ class ArrayProblem(AbstractLocalSearchProblem):
         >>> problem._order
         array([0, 3, 2, 1])
 
+    Using a smaller data type for the order:
+
+    .. doctest::
+
+        >>> import numpy
+        >>> from lclpy.localsearch.move.tsp_array_swap import TspArraySwap
+        >>> from lclpy.evaluation.tsp_evaluation_function \\
+        ...     import TspEvaluationFunction
+        >>> from lclpy.problem.array_problem import ArrayProblem
+        ... # init distance matrix
+        >>> distance_matrix = numpy.array(
+        ... [[0, 2, 5, 8],
+        ...  [2, 0, 4, 1],
+        ...  [5, 4, 0, 7],
+        ...  [8, 1, 7, 0]])
+        ... # init move function
+        >>> size = distance_matrix.shape[0]
+        >>> move_func = TspArraySwap(size)
+        ... # init evaluation function
+        >>> evaluation_func = TspEvaluationFunction(distance_matrix)
+        ... # init problem
+        >>> problem = ArrayProblem(evaluation_func, move_func, size,
+        ...                        dtype=numpy.int16)
+        ... # the order of the problem
+        >>> problem._order
+        array([0, 1, 2, 3], dtype=int16)
+        >>> problem.evaluate()
+        21
+
+    One evaluation function can be shared by problems with different move
+    functions, every problem makes its own delta evaluation object:
+
+    .. doctest::
+
+        >>> import numpy
+        >>> from lclpy.localsearch.move.array_swap import ArraySwap
+        >>> from lclpy.localsearch.move.array_reverse_order \\
+        ...     import ArrayReverseOrder
+        >>> from lclpy.evaluation.tsp_evaluation_function \\
+        ...     import TspEvaluationFunction
+        >>> from lclpy.problem.array_problem import ArrayProblem
+        ... # init distance matrix
+        >>> distance_matrix = numpy.array(
+        ... [[0, 2, 5, 8, 3],
+        ...  [2, 0, 4, 1, 6],
+        ...  [5, 4, 0, 7, 2],
+        ...  [8, 1, 7, 0, 9],
+        ...  [3, 6, 2, 9, 0]])
+        >>> size = distance_matrix.shape[0]
+        ... # init the shared evaluation function
+        >>> evaluation_func = TspEvaluationFunction(distance_matrix)
+        ... # init problems
+        >>> swap_problem = ArrayProblem(evaluation_func, ArraySwap(size), size)
+        >>> reverse_problem = ArrayProblem(evaluation_func,
+        ...                                ArrayReverseOrder(size), size)
+        ... # every delta equals the difference of the full evaluations
+        >>> def delta_is_correct(problem, move):
+        ...     before = problem.evaluate()
+        ...     delta = problem.evaluate_move(move)
+        ...     problem.move(move)
+        ...     after = problem.evaluate()
+        ...     problem.undo_move(move)
+        ...     return delta == after - before
+        >>> all(delta_is_correct(swap_problem, move)
+        ...     for move in swap_problem.get_moves())
+        True
+        >>> all(delta_is_correct(reverse_problem, move)
+        ...     for move in reverse_problem.get_moves())
+        True
+
     """
 
-    def __init__(self, evaluation_function, move_function, size, order=None):
+    __slots__ = ('_evaluation_function', '_move_function', '_order',
+                 '_starting_order', 'best_order', 'best_order_value',
+                 '_evaluation_cache_size', '_evaluation_cache',
+                 '_is_multi_neighbourhood', 'current_neighbourhood',
+                 'neighbourhood_size', '_move', '_undo_move', '_evaluate',
+                 '_delta_evaluate', '_delta_evaluate_all', '_moves_array')
+
+    def __init__(self, evaluation_function, move_function, size, order=None,
+                 evaluation_cache_size=0, dtype=None):
         super().__init__()
 
         # init variables
         self._evaluation_function = evaluation_function
         self._move_function = move_function
 
-        if self._move_function.get_move_type() is not 'multi_neighbourhood':
-            self.first_neighbourhood = not_multi_move_type
-            self.next_neighbourhood = not_multi_move_type
-            self.previous_neighbourhood = not_multi_move_type
-            self.select_get_moves = not_multi_move_type
-            self.select_random_move = not_multi_move_type
+        # the delta evaluation object is made for this problem, this way the
+        # evaluation function can be shared by problems with different move
+        # functions without being altered
+        try:
+            delta_evaluate_object = delta_eval_func(evaluation_function,
+                                                    move_function)
+        except NotImplementedError:
+            # no delta evaluation for this combination, the delta_evaluate
+            # method of the evaluation function itself will be used
+            delta_evaluate_object = None
+            self._delta_evaluate = evaluation_function.delta_evaluate
         else:
+            self._delta_evaluate = delta_evaluate_object.delta_evaluate
+
+        # bound methods used on every iteration, this avoids looking up the
+        # method on the move and evaluation function for every call
+        self._move = move_function.move
+        self._undo_move = move_function.undo_move
+        self._evaluate = evaluation_function.evaluate
+
+        # vectorized delta evaluation of many moves, used by best_move if the
+        # delta evaluation object supports it
+        self._delta_evaluate_all = getattr(
+            delta_evaluate_object, 'delta_evaluate_all', None)
+        self._moves_array = None
+
+        self._is_multi_neighbourhood = \
+            move_function.get_move_type() == 'multi_neighbourhood'
+
+        if self._is_multi_neighbourhood:
             self.current_neighbourhood = 0
             self.neighbourhood_size = move_function.size()
 
+        if dtype is not None and numpy.iinfo(dtype).max < size - 1:
+            raise ValueError('The dtype %s is too small for an order of size '
+                             '%d.' % (numpy.dtype(dtype), size))
+
         if order is None:
-            self._order = numpy.arange(size)
+            self._order = numpy.arange(size, dtype=dtype)
         else:
-            self._order = numpy.array(order)
+            # numpy.array always copies, so the order is a new contiguous
+            # array that doesn't share memory with the given order
+            self._order = numpy.array(order, dtype=dtype)
 
         self._starting_order = numpy.array(self._order)
 
+        # preallocated buffer, set_as_best copies _order into it
+        self.best_order = numpy.array(self._order)
+        self.best_order_value = None
+
+        self._evaluation_cache_size = evaluation_cache_size
+        self._evaluation_cache = OrderedDict()
+
     def move(self, move):
         """Performs a move on _order.
 
@@ -170,7 +335,7 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
-        self._move_function.move(self._order, move)
+        self._move(self._order, move)
 
     def undo_move(self, move):
         """Undoes a move on _order .
@@ -182,7 +347,7 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
-        self._move_function.undo_move(self._order, move)
+        self._undo_move(self._order, move)
 
     def get_moves(self):
         """An iterable that returns all valid moves in the complete neighbourhood.
@@ -324,9 +489,166 @@ class ArrayProblem(AbstractLocalSearchProblem):
             >>> problem.evaluate_move((2, 3))
             -6
 
+        The move function doesn't need to be passed to the evaluation
+        function, the problem makes its own delta evaluation object for it:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.localsearch.move.tsp_array_swap \\
+            ...     import TspArraySwap
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.problem.array_problem import ArrayProblem
+            ... # init distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8],
+            ...  [2, 0, 4, 1],
+            ...  [5, 4, 0, 7],
+            ...  [8, 1, 7, 0]])
+            ... # init move function
+            >>> size = distance_matrix.shape[0]
+            >>> move_func = TspArraySwap(size)
+            ... # init evaluation function without move function
+            >>> evaluation_func = TspEvaluationFunction(distance_matrix)
+            ... # init problem
+            >>> problem = ArrayProblem(evaluation_func, move_func, size)
+            ... # tests
+            >>> problem.evaluate_move((1, 2))
+            -3
+            >>> problem.evaluate_move((2, 3))
+            -6
+
+        """
+
+        return self._delta_evaluate(self._order, move)
+
+    def best_move(self, minimise=True):
+        """Searches the complete neighbourhood for the best move.
+
+        If the delta evaluation supports it, all moves are evaluated at once
+        with numpy. Else every move is evaluated with evaluate_move. If
+        several moves are equally good, the first one is returned.
+
+        Parameters
+        ----------
+        minimise : bool, optional
+            True if a smaller delta value is better, False if a bigger delta
+            value is better. The default is True.
+
+        Returns
+        -------
+        move : tuple of int or None
+            The best move. None if the neighbourhood contains no moves.
+        delta : int or float
+            The delta value of the best move. If the neighbourhood contains no
+            moves, it is infinite when minimising and minus infinite when
+            maximising.
+
+        Examples
+        --------
+        A simple example:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.localsearch.move.tsp_array_swap \\
+            ...     import TspArraySwap
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.problem.array_problem import ArrayProblem
+            ... # init distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8],
+            ...  [2, 0, 4, 1],
+            ...  [5, 4, 0, 7],
+            ...  [8, 1, 7, 0]])
+            ... # init move function
+            >>> size = distance_matrix.shape[0]
+            >>> move_func = TspArraySwap(size)
+            ... # init evaluation function
+            >>> evaluation_func = TspEvaluationFunction(distance_matrix,
+            ...                                         move_func)
+            ... # init problem
+            >>> problem = ArrayProblem(evaluation_func, move_func, size)
+            ... # tests
+            >>> problem.best_move()
+            ((2, 3), -6)
+            >>> problem.best_move(minimise=False)
+            ((1, 3), 0)
+
         """
 
-        return self._evaluation_function.delta_evaluate(self._order, move)
+        if self._delta_evaluate_all is None:
+            return super().best_move(minimise)
+
+        deltas = self.evaluate_all_moves()
+
+        if len(deltas) == 0:
+            return (None, float("inf") if minimise else float("-inf"))
+
+        if minimise:
+            index = deltas.argmin()
+        else:
+            index = deltas.argmax()
+
+        return (tuple(self._moves_array[index].tolist()), deltas[index])
+
+    def evaluate_all_moves(self):
+        """Evaluates every move of the complete neighbourhood.
+
+        If the delta evaluation supports it, all moves are evaluated at once
+        with numpy. Else every move is evaluated with evaluate_move.
+
+        Returns
+        -------
+        numpy.ndarray
+            The delta value of every move, in the order of get_moves.
+
+        Examples
+        --------
+        A simple example:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.localsearch.move.tsp_array_swap \\
+            ...     import TspArraySwap
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.problem.array_problem import ArrayProblem
+            ... # init distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8],
+            ...  [2, 0, 4, 1],
+            ...  [5, 4, 0, 7],
+            ...  [8, 1, 7, 0]])
+            ... # init move function
+            >>> size = distance_matrix.shape[0]
+            >>> move_func = TspArraySwap(size)
+            ... # init evaluation function
+            >>> evaluation_func = TspEvaluationFunction(distance_matrix,
+            ...                                         move_func)
+            ... # init problem
+            >>> problem = ArrayProblem(evaluation_func, move_func, size)
+            ... # tests
+            >>> list(problem.get_moves())
+            [(1, 2), (1, 3), (2, 3)]
+            >>> problem.evaluate_all_moves()
+            array([-3,  0, -6])
+
+        """
+
+        if self._delta_evaluate_all is None:
+            evaluate_move = self.evaluate_move
+            return numpy.array(
+                [evaluate_move(move) for move in self.get_moves()])
+
+        if self._moves_array is None:
+            self._moves_array = \
+                numpy.array(list(self.get_moves()), dtype=int).reshape(-1, 2)
+
+        return self._delta_evaluate_all(self._order, self._moves_array)
 
     def evaluate(self):
         """A function to evaluate the current _order.
@@ -336,9 +658,64 @@ class ArrayProblem(AbstractLocalSearchProblem):
         int or float
             An evaluation of the current state of _order.
 
+        Examples
+        --------
+        Remembering the values of the 2 most recently evaluated orders:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.localsearch.move.tsp_array_swap \\
+            ...     import TspArraySwap
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.problem.array_problem import ArrayProblem
+            ... # init distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8],
+            ...  [2, 0, 4, 1],
+            ...  [5, 4, 0, 7],
+            ...  [8, 1, 7, 0]])
+            ... # init move function
+            >>> size = distance_matrix.shape[0]
+            >>> move_func = TspArraySwap(size)
+            ... # init evaluation function
+            >>> evaluation_func = TspEvaluationFunction(distance_matrix)
+            ... # init problem
+            >>> problem = ArrayProblem(evaluation_func, move_func, size,
+            ...                        evaluation_cache_size=2)
+            ... # tests
+            >>> problem.evaluate()
+            21
+            >>> problem.move((2, 3))
+            >>> problem.evaluate()
+            15
+            >>> problem.reset()
+            >>> problem.evaluate()
+            21
+            >>> len(problem._evaluation_cache)
+            2
+
         """
 
-        return self._evaluation_function.evaluate(self._order)
+        if not self._evaluation_cache_size:
+            return self._evaluate(self._order)
+
+        cache = self._evaluation_cache
+        key = self._order.tobytes()
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        value = self._evaluate(self._order)
+        cache[key] = value
+
+        # discard the least recently used entry if the cache is too big
+        if len(cache) > self._evaluation_cache_size:
+            cache.popitem(last=False)
+
+        return value
 
     def set_as_best(self, evaluation_value):
         """Sets the current _order as the new best_order
@@ -352,7 +729,9 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
-        self.best_order = numpy.copy(self._order)
+        # both arrays are contiguous and have the same dtype, casting='no'
+        # ensures that this stays a plain memory copy
+        copyto(self.best_order, self._order, casting='no')
         self.best_order_value = evaluation_value
 
     def state(self):
@@ -397,7 +776,115 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
-        return tuple(self._order)
+        # tolist converts the values to python ints in a single call, which
+        # is faster than iterating over the numpy array.
+        return tuple(self._order.tolist())
+
+    def fingerprint(self):
+        """Returns a cheap hashable key that describes the current state.
+
+        The key is a copy of the raw bytes of the current order. It's cheaper
+        to create and to hash than the tuple returned by state, which makes it
+        suitable to check if a state was already visited with a set or dict.
+        Fingerprints can only be compared with fingerprints of the same
+        problem.
+
+        Returns
+        -------
+        bytes
+            A key associated with the current state.
+
+        Examples
+        --------
+        Recognising an already visited state:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.localsearch.move.tsp_array_swap \\
+            ...     import TspArraySwap
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.problem.array_problem import ArrayProblem
+            ... # init distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8],
+            ...  [2, 0, 4, 1],
+            ...  [5, 4, 0, 7],
+            ...  [8, 1, 7, 0]])
+            ... # init move function
+            >>> size = distance_matrix.shape[0]
+            >>> move_func = TspArraySwap(size)
+            ... # init evaluation function
+            >>> evaluation_func = TspEvaluationFunction(distance_matrix,
+            ...                                         move_func)
+            ... # init problem
+            >>> problem = ArrayProblem(evaluation_func, move_func, size)
+            >>> visited = {problem.fingerprint()}
+            >>> problem.move((1, 3))
+            >>> problem.fingerprint() in visited
+            False
+            >>> problem.move((1, 3))
+            >>> problem.fingerprint() in visited
+            True
+
+        """
+
+        return self._order.tobytes()
+
+    def peek_order(self):
+        """Returns a read-only view of the current order.
+
+        The view shares its memory with the order of the problem, so no
+        values are copied, but it can't be used to alter the order. Note that
+        the view reflects all later moves, it should be copied if the current
+        order needs to be kept.
+
+        Returns
+        -------
+        numpy.ndarray
+            A read-only view of the current order.
+
+        Examples
+        --------
+        The view follows the moves on the problem:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.localsearch.move.tsp_array_swap \\
+            ...     import TspArraySwap
+            >>> from lclpy.evaluation.tsp_evaluation_function \\
+            ...     import TspEvaluationFunction
+            >>> from lclpy.problem.array_problem import ArrayProblem
+            ... # init distance matrix
+            >>> distance_matrix = numpy.array(
+            ... [[0, 2, 5, 8],
+            ...  [2, 0, 4, 1],
+            ...  [5, 4, 0, 7],
+            ...  [8, 1, 7, 0]])
+            ... # init move function
+            >>> size = distance_matrix.shape[0]
+            >>> move_func = TspArraySwap(size)
+            ... # init evaluation function
+            >>> evaluation_func = TspEvaluationFunction(distance_matrix,
+            ...                                         move_func)
+            ... # init problem
+            >>> problem = ArrayProblem(evaluation_func, move_func, size)
+            >>> order = problem.peek_order()
+            >>> order
+            array([0, 1, 2, 3])
+            >>> problem.move((1, 3))
+            >>> order
+            array([0, 3, 2, 1])
+            >>> order.flags.writeable
+            False
+
+        """
+
+        view = self._order.view()
+        view.flags.writeable = False
+        return view
 
     def first_neighbourhood(self):
         """Changes the current neighbourhood to the first neighbourhood.
@@ -412,6 +899,9 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
+        if not self._is_multi_neighbourhood:
+            not_multi_move_type()
+
         self.current_neighbourhood = 0
 
     def next_neighbourhood(self):
@@ -433,9 +923,12 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
+        if not self._is_multi_neighbourhood:
+            not_multi_move_type()
+
         self.current_neighbourhood += 1
 
-        if self.current_neighbourhood is self.neighbourhood_size:
+        if self.current_neighbourhood == self.neighbourhood_size:
             self.current_neighbourhood -= 1
             raise NoNextNeighbourhood('There is no next neighbourhood.')
 
@@ -455,7 +948,10 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
-        if self.current_neighbourhood is not 0:
+        if not self._is_multi_neighbourhood:
+            not_multi_move_type()
+
+        if self.current_neighbourhood != 0:
             self.current_neighbourhood -= 1
 
     def select_get_moves(self):
@@ -477,6 +973,9 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
+        if not self._is_multi_neighbourhood:
+            not_multi_move_type()
+
         return self._move_function.select_get_moves(self.current_neighbourhood)
 
     def select_random_move(self):
@@ -497,13 +996,19 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
+        if not self._is_multi_neighbourhood:
+            not_multi_move_type()
+
         return self._move_function.select_random_move(
             self.current_neighbourhood)
 
     def reset(self):
         """Resets the object back to it's state after init.
 
-        _order is replaced by a copy of _starting_order.
+        _starting_order is copied into the existing _order array. best_order
+        is replaced by a new array, so results that refer to the old
+        best_order aren't altered by later runs. best_order_value is set to
+        None.
 
         Examples
         --------
@@ -590,4 +1095,7 @@ class ArrayProblem(AbstractLocalSearchProblem):
 
         """
 
-        self._order = numpy.array(self._starting_order)
+        # _order isn't returned to the user, so its buffer can be reused
+        copyto(self._order, self._starting_order, casting='no')
+        self.best_order = numpy.array(self._starting_order)
+        self.best_order_value = None
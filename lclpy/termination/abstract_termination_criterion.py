@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class AbstractTerminationCriterion(ABC):
     """Template to create termination criterions."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -31,6 +33,24 @@ class AbstractTerminationCriterion(ABC):
 
         pass
 
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running, but only needs a single call.
+
+        Returns
+        -------
+        bool
+            The function returns true if the algorithm has to continue
+            running, if the function returns false the algorithm needs to
+            stop running.
+
+        """
+
+        self.iteration_done()
+        return self.keep_running()
+
     def check_first_value(self, value):
         """Function that should be called once before the main loop.
 
@@ -57,6 +77,24 @@ class AbstractTerminationCriterion(ABC):
 
         pass
 
+    def check_new_values(self, values):
+        """Checks multiple values in the order they are given.
+
+        Has the same effect as calling check_new_value for every value.
+        Criteria can override this method with a vectorised implementation.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or iterable of int or float
+            Values from the evaluation function.
+
+        """
+
+        check_new_value = self.check_new_value
+
+        for value in values:
+            check_new_value(value)
+
     def check_variable(self, variable):
         """Checks a variable specific to an implementation.
 
@@ -11,6 +11,8 @@ class AlwaysTrueCriterion(AbstractTerminationCriterion):
 
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -26,6 +28,21 @@ class AlwaysTrueCriterion(AbstractTerminationCriterion):
 
         return True
 
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running.
+
+        Returns
+        -------
+        bool
+            Will always be True.
+
+        """
+
+        return True
+
     def reset(self):
         """Resets the object back to it's state after init."""
 
@@ -61,6 +61,8 @@ class MaxIterationsTerminationCriterion(AbstractTerminationCriterion):
 
     """
 
+    __slots__ = ('_max_iterations', '_iterations')
+
     def __init__(self, max_iterations=1000):
         super().__init__()
         self._max_iterations = max_iterations
@@ -89,6 +91,22 @@ class MaxIterationsTerminationCriterion(AbstractTerminationCriterion):
 
         self._iterations += 1
 
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running.
+
+        Returns
+        -------
+        bool
+            True if the algorithm has to continue running, else False.
+
+        """
+
+        self._iterations += 1
+        return self._iterations < self._max_iterations
+
     def reset(self):
         """Resets the object back to it's state after init.
 
@@ -1,4 +1,4 @@
-from time import time
+from time import perf_counter_ns
 from lclpy.termination.abstract_termination_criterion \
     import AbstractTerminationCriterion
 
@@ -11,20 +11,39 @@ class MaxSecondsTerminationCriterion(AbstractTerminationCriterion):
     is finished. The extra time that the algorithm will run depends on the
     duration of the last iteration.
 
+    The time is measured with perf_counter_ns, a monotonic clock, so changes
+    of the system time don't influence the criterion. It's the same clock
+    that is used for the timestamps of the logged data.
+
     Parameters
     ----------
     max_seconds : int or float, optional
         The maximal amount of seconds passed. The default is 60 seconds.
+    poll_interval : int or None, optional
+        The clock is only read once every poll_interval iterations. For very
+        short iterations, reading the clock can take a considerable part of
+        the time of an iteration. A bigger value makes the criterion less
+        exact, it can terminate up to poll_interval - 1 iterations late. If
+        None, the interval is adapted while running, so roughly a millisecond
+        passes between 2 reads of the clock. The default is 1, which reads the
+        clock after every iteration.
 
     Attributes
     ----------
     _max_seconds : int or float
         The maximal amount of seconds passed.
-    _seconds : float
-        The amount of seconds passed since the start of the iterations
-    _start : float
-        The moment when the time starts to be measured in seconds measured
-        from the epoch.
+    _max_ns : int
+        The maximal amount of nanoseconds passed.
+    _poll_interval : int
+        The amount of iterations between 2 reads of the clock.
+    _adaptive : bool
+        True if _poll_interval is adapted while running.
+    _countdown : int
+        The amount of iterations left before the clock is read again.
+    _deadline : int
+        The moment in nanoseconds when the algorithm needs to stop.
+    _now : int
+        The moment in nanoseconds when the clock was last read.
 
     Examples
     --------
@@ -73,13 +92,70 @@ class MaxSecondsTerminationCriterion(AbstractTerminationCriterion):
         >>> time_passed < 4
         True
 
+    Running for 1 second, while reading the clock only once every 1000
+    iterations:
+
+    .. doctest::
+
+        >>> import time
+        >>> from lclpy.termination.max_seconds_termination_criterion \\
+        ...     import MaxSecondsTerminationCriterion
+        ... # init
+        >>> test = MaxSecondsTerminationCriterion(1, poll_interval=1000)
+        ... # start and stop will be used to measure the time passed.
+        >>> start = time.time()
+        ... # start the timing of the termination criterion
+        >>> test.start_timing()
+        ... # loop
+        >>> while test.keep_running():
+        ...     pass # code to execute
+        ...     test.iteration_done()
+        >>> stop = time.time()
+        >>> time_passed = stop - start
+        >>> 1 <= time_passed < 2
+        True
+
+    Running for 1 second, while adapting the amount of iterations between the
+    reads of the clock:
+
+    .. doctest::
+
+        >>> import time
+        >>> from lclpy.termination.max_seconds_termination_criterion \\
+        ...     import MaxSecondsTerminationCriterion
+        ... # init
+        >>> test = MaxSecondsTerminationCriterion(1, poll_interval=None)
+        ... # start and stop will be used to measure the time passed.
+        >>> start = time.time()
+        ... # start the timing of the termination criterion
+        >>> test.start_timing()
+        ... # loop
+        >>> while test.keep_running():
+        ...     pass # code to execute
+        ...     test.iteration_done()
+        >>> stop = time.time()
+        >>> time_passed = stop - start
+        >>> 1 <= time_passed < 2
+        True
+
     """
 
-    def __init__(self, max_seconds=60):
+    __slots__ = ('_max_seconds', '_max_ns', '_adaptive', '_poll_interval',
+                 '_countdown', '_deadline', '_now')
+
+    def __init__(self, max_seconds=60, poll_interval=1):
         super().__init__()
-        self._start = 0
         self._max_seconds = max_seconds
-        self._seconds = 0
+        self._max_ns = int(max_seconds * 1000000000)
+
+        self._adaptive = poll_interval is None
+        if self._adaptive:
+            poll_interval = 1
+
+        self._poll_interval = poll_interval
+        self._countdown = poll_interval
+        self._deadline = self._max_ns
+        self._now = 0
 
     def keep_running(self):
         """function to determine if an algorithm needs to continue running
@@ -93,26 +169,61 @@ class MaxSecondsTerminationCriterion(AbstractTerminationCriterion):
 
         """
 
-        return self._seconds < self._max_seconds
+        return self._now < self._deadline
 
     def start_timing(self):
         """function to be called before the iterations
 
-        Sets _start to the current time in seconds from the epoch.
+        Sets _deadline to max_seconds after the current time.
 
         """
 
-        self._start = time()
+        if self._adaptive:
+            self._poll_interval = 1
+
+        self._now = perf_counter_ns()
+        self._deadline = self._now + self._max_ns
+        self._countdown = self._poll_interval
 
     def iteration_done(self):
         """function to be called after every iteration
 
-        Sets _seconds to be the difference between the current time and the
-        start time.
+        Reads the clock if poll_interval iterations passed since the last
+        read.
+
+        """
+
+        self._countdown -= 1
+
+        if self._countdown == 0:
+            now = perf_counter_ns()
+
+            if self._adaptive:
+                # keep the time between 2 reads between 0.5 and 2 ms
+                elapsed = now - self._now
+                if elapsed < 500000:
+                    self._poll_interval *= 2
+                elif elapsed > 2000000 and self._poll_interval > 1:
+                    self._poll_interval //= 2
+
+            self._countdown = self._poll_interval
+            self._now = now
+
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running.
+
+        Returns
+        -------
+        bool
+            True if the algorithm has to continue running, else False.
 
         """
 
-        self._seconds = time() - self._start
+        self.iteration_done()
+        return self._now < self._deadline
 
     def reset(self):
         """Resets the object back to it's state after init.
@@ -160,5 +271,9 @@ class MaxSecondsTerminationCriterion(AbstractTerminationCriterion):
 
         """
 
-        self._start = 0
-        self._seconds = 0
+        if self._adaptive:
+            self._poll_interval = 1
+
+        self._countdown = self._poll_interval
+        self._deadline = self._max_ns
+        self._now = 0
@@ -69,6 +69,8 @@ class MinTemperatureTerminationCriterion(AbstractTerminationCriterion):
 
     """
 
+    __slots__ = ('_min_temperature', '_run')
+
     def __init__(self, min_temperature=10):
         super().__init__()
         self._min_temperature = min_temperature
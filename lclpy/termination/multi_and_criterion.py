@@ -12,9 +12,27 @@ class MultiAndCriterion(MultiCriterion):
 
     Attributes
     ----------
-    criteria : list or tuple of AbstractTerminationCriterion
-        An iterable object containing the intialised termination criterions one
-        wishes to use.
+    criteria : tuple of AbstractTerminationCriterion
+        The intialised termination criterions one wishes to use. The tuple
+        can't be altered, assigning new criteria gathers their bound methods
+        again.
+    _criteria : tuple of AbstractTerminationCriterion
+        The value of criteria.
+    _keep_running_functions : tuple
+        The bound keep_running methods of the criteria.
+    _iteration_done_functions : tuple
+        The bound iteration_done methods of the criteria that implement it.
+    _check_new_value_functions : tuple
+        The bound check_new_value methods of the criteria that implement it.
+    _check_new_values_functions : tuple
+        The bound check_new_values methods of the criteria that implement
+        check_new_value or check_new_values.
+    _check_variable_functions : tuple
+        The bound check_variable methods of the criteria that implement it.
+    _start_timing_functions : tuple
+        The bound start_timing methods of the criteria that implement it.
+    _step_functions : tuple
+        The bound step methods of the criteria.
 
     Examples
     --------
@@ -111,6 +129,8 @@ class MultiAndCriterion(MultiCriterion):
 
         """
 
+    __slots__ = ()
+
     def keep_running(self):
         """function to determine if the algorithm needs to continue running.
 
@@ -125,7 +145,28 @@ class MultiAndCriterion(MultiCriterion):
 
         """
 
-        for criterion in self.criteria:
-            if criterion.keep_running() is True:
+        for keep_running in self._keep_running_functions:
+            if keep_running():
                 return True
         return False
+
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running. Every criterion is stepped.
+
+        Returns
+        -------
+        bool
+            True if one or more of the criteria want to continue, else False.
+
+        """
+
+        running = False
+
+        for step in self._step_functions:
+            if step():
+                running = True
+
+        return running
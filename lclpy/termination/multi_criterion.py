@@ -2,6 +2,52 @@ from lclpy.termination.abstract_termination_criterion \
     import AbstractTerminationCriterion
 
 
+def _implements(criterion, name):
+    """Checks if a criterion overrides a method of AbstractTerminationCriterion.
+
+    Parameters
+    ----------
+    criterion : AbstractTerminationCriterion
+        The termination criterion.
+    name : str
+        The name of the method.
+
+    Returns
+    -------
+    bool
+        True if the criterion doesn't inherit the method from
+        AbstractTerminationCriterion, else False.
+
+    """
+
+    return getattr(type(criterion), name) is not \
+        getattr(AbstractTerminationCriterion, name)
+
+
+def _implemented_methods(criteria, name):
+    """Returns the bound methods with a certain name of the given criteria.
+
+    Criteria that inherit the empty implementation of
+    AbstractTerminationCriterion are skipped, calling them has no effect.
+
+    Parameters
+    ----------
+    criteria : list or tuple of AbstractTerminationCriterion
+        The termination criteria.
+    name : str
+        The name of the method.
+
+    Returns
+    -------
+    tuple
+        The bound methods of the criteria that implement the method.
+
+    """
+
+    return tuple(getattr(criterion, name) for criterion in criteria
+                 if _implements(criterion, name))
+
+
 class MultiCriterion(AbstractTerminationCriterion):
     """Class to combine multiple terminationcriteria.
 
@@ -13,9 +59,27 @@ class MultiCriterion(AbstractTerminationCriterion):
 
     Attributes
     ----------
-    criteria : list or tuple of AbstractTerminationCriterion
-        An iterable object containing the intialised termination criterions one
-        wishes to use.
+    criteria : tuple of AbstractTerminationCriterion
+        The intialised termination criterions one wishes to use. The tuple
+        can't be altered, assigning new criteria gathers their bound methods
+        again.
+    _criteria : tuple of AbstractTerminationCriterion
+        The value of criteria.
+    _keep_running_functions : tuple
+        The bound keep_running methods of the criteria.
+    _iteration_done_functions : tuple
+        The bound iteration_done methods of the criteria that implement it.
+    _check_new_value_functions : tuple
+        The bound check_new_value methods of the criteria that implement it.
+    _check_new_values_functions : tuple
+        The bound check_new_values methods of the criteria that implement
+        check_new_value or check_new_values.
+    _check_variable_functions : tuple
+        The bound check_variable methods of the criteria that implement it.
+    _start_timing_functions : tuple
+        The bound start_timing methods of the criteria that implement it.
+    _step_functions : tuple
+        The bound step methods of the criteria.
 
     Examples
     --------
@@ -113,10 +177,79 @@ class MultiCriterion(AbstractTerminationCriterion):
 
     """
 
+    __slots__ = ('_criteria', '_keep_running_functions',
+                 '_iteration_done_functions', '_check_new_value_functions',
+                 '_check_new_values_functions', '_check_variable_functions',
+                 '_start_timing_functions', '_step_functions')
+
     def __init__(self, criteria):
         super().__init__()
         self.criteria = criteria
 
+    @property
+    def criteria(self):
+        """tuple of AbstractTerminationCriterion: The combined criteria.
+
+        The criteria are stored in a tuple, so they can't be altered in place.
+        Assigning new criteria gathers their bound methods again.
+
+        Examples
+        --------
+        Replacing the criteria:
+
+        .. doctest::
+
+            >>> from lclpy.termination.max_iterations_termination_criterion \\
+            ...     import MaxIterationsTerminationCriterion
+            >>> from lclpy.termination.multi_criterion import MultiCriterion
+            ... # init
+            >>> multi_criterion = MultiCriterion(
+            ...     [MaxIterationsTerminationCriterion(10)])
+            ... # replace the criteria
+            >>> multi_criterion.criteria = [
+            ...     MaxIterationsTerminationCriterion(3)]
+            >>> type(multi_criterion.criteria)
+            <class 'tuple'>
+            >>> # the new criteria are used
+            >>> iterations = 0
+            >>> multi_criterion.start_timing()
+            >>> while multi_criterion.keep_running():
+            ...     iterations += 1
+            ...     multi_criterion.iteration_done()
+            >>> iterations
+            3
+
+        """
+
+        return self._criteria
+
+    @criteria.setter
+    def criteria(self, criteria):
+        self._criteria = tuple(criteria)
+
+        # the bound methods are gathered once, so they don't need to be looked
+        # up for every criterion on every call, methods that aren't
+        # implemented by a criterion are left out
+        self._keep_running_functions = tuple(
+            criterion.keep_running for criterion in self._criteria)
+        self._iteration_done_functions = _implemented_methods(
+            self._criteria, 'iteration_done')
+        self._check_new_value_functions = _implemented_methods(
+            self._criteria, 'check_new_value')
+        self._check_variable_functions = _implemented_methods(
+            self._criteria, 'check_variable')
+        self._start_timing_functions = _implemented_methods(
+            self._criteria, 'start_timing')
+        self._step_functions = tuple(
+            criterion.step for criterion in self._criteria)
+
+        # the default check_new_values calls check_new_value, so it only has
+        # no effect if neither of both methods is implemented
+        self._check_new_values_functions = tuple(
+            criterion.check_new_values for criterion in self._criteria
+            if _implements(criterion, 'check_new_values')
+            or _implements(criterion, 'check_new_value'))
+
     def keep_running(self):
         """function to determine if the algorithm needs to continue running.
 
@@ -131,16 +264,38 @@ class MultiCriterion(AbstractTerminationCriterion):
 
         """
 
-        for criterion in self.criteria:
-            if criterion.keep_running() is False:
+        for keep_running in self._keep_running_functions:
+            if not keep_running():
                 return False
         return True
 
     def iteration_done(self):
         """function to be called after every iteration."""
 
-        for criterion in self.criteria:
-            criterion.iteration_done()
+        for iteration_done in self._iteration_done_functions:
+            iteration_done()
+
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running. Every criterion is stepped, even if an earlier one
+        already stopped the algorithm.
+
+        Returns
+        -------
+        bool
+            True if none of the criteria stopped the algorithm, else False.
+
+        """
+
+        running = True
+
+        for step in self._step_functions:
+            if not step():
+                running = False
+
+        return running
 
     def check_new_value(self, value):
         """Checks a value.
@@ -152,14 +307,27 @@ class MultiCriterion(AbstractTerminationCriterion):
 
         """
 
-        for criterion in self.criteria:
-            criterion.check_new_value(value)
+        for check_new_value in self._check_new_value_functions:
+            check_new_value(value)
+
+    def check_new_values(self, values):
+        """Checks multiple values in the order they are given.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or sequence of int or float
+            Values from the evaluation function.
+
+        """
+
+        for check_new_values in self._check_new_values_functions:
+            check_new_values(values)
 
     def start_timing(self):
         """Starts an internal timer if needed."""
 
-        for criterion in self.criteria:
-            criterion.start_timing()
+        for start_timing in self._start_timing_functions:
+            start_timing()
 
     def check_variable(self, variable):
         """Checks a variable specific to an implementation.
@@ -173,8 +341,8 @@ class MultiCriterion(AbstractTerminationCriterion):
 
         """
 
-        for criterion in self.criteria:
-            criterion.check_variable(variable)
+        for check_variable in self._check_variable_functions:
+            check_variable(variable)
 
     def reset(self):
         """Resets the object back to it's state after init.
@@ -225,5 +393,5 @@ class MultiCriterion(AbstractTerminationCriterion):
 
         """
 
-        for criterion in self.criteria:
+        for criterion in self._criteria:
             criterion.reset()
@@ -1,6 +1,6 @@
 from lclpy.termination.abstract_termination_criterion \
     import AbstractTerminationCriterion
-from lclpy.aidfunc.is_improvement_func import bigger, smaller
+import numpy
 
 
 class MustImproveTerminationCriterion(AbstractTerminationCriterion):
@@ -18,8 +18,10 @@ class MustImproveTerminationCriterion(AbstractTerminationCriterion):
     _old_best_value: int
         The last value. Is initialised as infinite (minimise = True)
         or minus infinite (minimise = False)
-    _function : function
-        The function used to judge if a value is an improvement.
+    _sign : int
+        1 when minimising, -1 when maximising. Values are multiplied with
+        _sign before comparing them, so a smaller product is always an
+        improvement.
     _run : bool
         True if no worse value has been encountered, False if this isn't the
         case.
@@ -90,19 +92,21 @@ class MustImproveTerminationCriterion(AbstractTerminationCriterion):
 
     """
 
+    __slots__ = ('_run', '_sign', '_old_best_value')
+
     def __init__(self, minimise=True):
         super().__init__()
 
         # init
         self._run = True
 
-        # choose intial _old_best_value value + pick judge function
+        # choose intial _old_best_value value + pick the sign
         if minimise:
-            self._function = smaller
-            self._old_best_value = float("inf")
+            self._sign = 1
+            self._old_best_value = numpy.float64("inf")
         else:
-            self._function = bigger
-            self._old_best_value = float("-inf")
+            self._sign = -1
+            self._old_best_value = numpy.float64("-inf")
 
     def keep_running(self):
         """function to determine if the algorithm needs to continue running
@@ -116,6 +120,21 @@ class MustImproveTerminationCriterion(AbstractTerminationCriterion):
         """
         return self._run
 
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling keep_running, the criterion doesn't
+        count iterations.
+
+        Returns
+        -------
+        bool
+            True if the algorithm has to continue running, else False.
+
+        """
+
+        return self._run
+
     def check_new_value(self, value):
         """function to be called after every calculation of the evaluation function.
 
@@ -126,11 +145,66 @@ class MustImproveTerminationCriterion(AbstractTerminationCriterion):
 
         """
 
-        if self._function(self._old_best_value, value):
+        # multiplying with the sign turns maximising into minimising, this
+        # avoids calling a separate judge function for every value
+        sign = self._sign
+
+        if sign * value < sign * self._old_best_value:
             self._old_best_value = value
         else:
             self._run = False
 
+    def check_new_values(self, values):
+        """Checks multiple values in the order they are given.
+
+        Has the same effect as calling check_new_value for every value, but
+        all values are checked at once.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or sequence of int or float
+            Values from the evaluation function.
+
+        Examples
+        --------
+        The third value isn't an improvement:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.termination.must_improve_termination_criterion \\
+            ...     import MustImproveTerminationCriterion
+            >>> test = MustImproveTerminationCriterion()
+            >>> test.check_new_values(numpy.array([10, 9, 8]))
+            >>> test.keep_running()
+            True
+            >>> test.check_new_values(numpy.array([7, 6, 6, 5]))
+            >>> test.keep_running()
+            False
+
+        """
+
+        values = numpy.asarray(values)
+
+        if values.size == 0:
+            return
+
+        # multiplying with the sign makes smaller values always better
+        signed_values = self._sign * values
+        signed_best_value = self._sign * self._old_best_value
+
+        # the best value before every value
+        previous_best = numpy.minimum.accumulate(
+            numpy.concatenate(([signed_best_value], signed_values[:-1])))
+
+        if (signed_values >= previous_best).any():
+            self._run = False
+
+        best_index = signed_values.argmin()
+
+        if signed_values[best_index] < signed_best_value:
+            self._old_best_value = values[best_index]
+
     def reset(self):
         """Resets the object back to it's state after init.
 
@@ -192,9 +266,9 @@ class MustImproveTerminationCriterion(AbstractTerminationCriterion):
         self._run = True
 
         # restore old_best value
-        if self._function is smaller:
+        if self._sign == 1:
             # if minimising
-            self._old_best_value = float("inf")
+            self._old_best_value = numpy.float64("inf")
         else:
             # if maximising
-            self._old_best_value = float("-inf")
+            self._old_best_value = numpy.float64("-inf")
@@ -1,6 +1,6 @@
 from lclpy.termination.abstract_termination_criterion \
     import AbstractTerminationCriterion
-from lclpy.aidfunc.is_improvement_func import bigger, smaller
+import numpy
 
 
 class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
@@ -15,13 +15,19 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
         If the goal is to minimise the evaluation function, this should be
         True. If the goal is to maximise the evlauation function, this should
         be False. The default is True.
+    min_relative_improvement : int or float, optional
+        A value is only considered an improvement if it's better than the best
+        value by at least this fraction of the absolute best value. This can
+        be used to stop runs that only find negligible improvements. The
+        default is 0, which considers every better value an improvement.
 
     Attributes
     ----------
     _max_iterations : int
         The maximal amount of iterations without improvement.
-    _iterations : int
-        The amount of iterations with no improvement.
+    _remaining : int
+        The amount of iterations without improvement that are left before the
+        criterion stops the algorithm.
     _run : bool
         Will be True if the maximal amount of iterations without improvement
         hasn't been reached yet, will be false if this isn't the case.
@@ -29,8 +35,15 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
         The last best value. Is initialised as minus infinite
         (improvement_is_bigger = True)
         or infinite (improvement_is_bigger = False)
-    _function : function
-        The function used to judge if a value is an improvement.
+    _sign : int
+        1 when minimising, -1 when maximising. Values are multiplied with
+        _sign before comparing them, so a smaller product is always an
+        improvement.
+    _min_relative_improvement : int or float
+        The minimal improvement as a fraction of the absolute best value.
+    _threshold : int or float
+        A value multiplied with _sign needs to be smaller than _threshold to
+        be an improvement.
 
     Examples
     --------
@@ -160,26 +173,62 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
         >>> index # == amount of iterations.
         11
 
+    3 iterations without an improvement of at least 10%. Smaller values are
+    considered improvements. The dataset eval_values is hardcoded:
+
+    .. doctest::
+
+        >>> import numpy
+        >>> from lclpy.termination.no_improvement_termination_criterion \\
+        ...     import NoImprovementTerminationCriterion
+        ... # creation of an array that contains the values that will be given
+        ... # to our termination criterion
+        >>> eval_values = numpy.array([95, 89, 85, 81, 80, 79, 78, 77, 76, 75])
+        ... # index is used to get values from the array.
+        ... # index is also used to count the amount of iterations
+        >>> index = 0
+        ... # init
+        >>> test = NoImprovementTerminationCriterion(
+        ...     3, min_relative_improvement=0.1)
+        >>> test.check_first_value(100)
+        ... # loop
+        >>> while test.keep_running():
+        ...     pass # other code to execute
+        ...     # check next value
+        ...     test.check_new_value(eval_values[index])
+        ...     pass # other code to execute
+        ...     # counting iterations + increment index
+        ...     index += 1
+        ...     test.iteration_done()
+        >>> index # == amount of iterations.
+        8
+
 
 
 
     """
 
-    def __init__(self, max_iterations=100, minimise=True):
+    __slots__ = ('_max_iterations', '_remaining', '_run', '_old_best_value',
+                 '_sign', '_min_relative_improvement', '_threshold')
+
+    def __init__(self, max_iterations=100, minimise=True,
+                 min_relative_improvement=0):
         super().__init__()
 
         # init
         self._max_iterations = max_iterations
-        self._iterations = 0
+        self._remaining = max_iterations
         self._run = True
+        self._min_relative_improvement = min_relative_improvement
+        self._threshold = numpy.float64("inf")
 
-        # choose intial _old_best_value value + pick judge function
+        # choose intial _old_best_value value + pick the sign
         if minimise:
-            self._function = smaller
-            self._old_best_value = float("inf")
+            self._sign = 1
+            self._old_best_value = numpy.float64("inf")
         else:
-            self._function = bigger
-            self._old_best_value = float("-inf")
+            self._sign = -1
+            self._old_best_value = numpy.float64("-inf")
 
     def keep_running(self):
         """Function to determine if the algorithm needs to continue running.
@@ -197,15 +246,36 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
     def iteration_done(self):
         """Function to be called after every iteration.
 
-        Increments _iterations by 1.
+        Decrements _remaining by 1.
+
+        """
+
+        # counting down avoids reading _max_iterations every iteration
+        self._remaining -= 1
+
+        if self._remaining == 0:
+            self._run = False
+
+    def step(self):
+        """Finishes an iteration and checks if the algorithm needs to continue.
+
+        Has the same effect as calling iteration_done followed by
+        keep_running.
+
+        Returns
+        -------
+        bool
+            True if the algorithm has to continue running, else False.
 
         """
 
-        self._iterations += 1
+        self._remaining -= 1
 
-        if self._iterations == self._max_iterations:
+        if self._remaining == 0:
             self._run = False
 
+        return self._run
+
     def check_first_value(self, value):
         """Function that should be called once before the main loop.
 
@@ -216,7 +286,21 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
 
         """
 
+        self._set_best_value(value)
+
+    def _set_best_value(self, value):
+        """Sets a new best value and the threshold derived from it.
+
+        Parameters
+        ----------
+        value : int or float
+            The new best value.
+
+        """
+
         self._old_best_value = value
+        self._threshold = self._sign * value - \
+            self._min_relative_improvement * abs(value)
 
     def check_new_value(self, value):
         """Function to be called after every improvement of the evaluation function.
@@ -232,9 +316,68 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
             used.
 
         """
-        if self._function(self._old_best_value, value):
-            self._iterations = -1
-            self._old_best_value = value
+        # multiplying with the sign turns maximising into minimising, the
+        # threshold already contains the minimal improvement
+        if self._sign * value < self._threshold:
+            # iteration_done will still be called for the current iteration
+            self._remaining = self._max_iterations + 1
+            self._set_best_value(value)
+
+    def check_new_values(self, values):
+        """Checks multiple values in the order they are given.
+
+        Has the same effect as calling check_new_value for every value, but
+        all values are checked at once. Only the best value can reset the
+        amount of iterations without improvement.
+
+        Parameters
+        ----------
+        values : numpy.ndarray or sequence of int or float
+            Values from the evaluation function.
+
+        Examples
+        --------
+        Only the first batch contains an improvement:
+
+        .. doctest::
+
+            >>> import numpy
+            >>> from lclpy.termination.no_improvement_termination_criterion \\
+            ...     import NoImprovementTerminationCriterion
+            >>> test = NoImprovementTerminationCriterion(2)
+            >>> test.check_first_value(10)
+            >>> test.check_new_values(numpy.array([12, 9, 11]))
+            >>> test.iteration_done()
+            >>> test.check_new_values(numpy.array([9, 13]))
+            >>> test.iteration_done()
+            >>> test.keep_running()
+            True
+            >>> test.check_new_values(numpy.array([10, 11]))
+            >>> test.iteration_done()
+            >>> test.keep_running()
+            False
+
+        """
+
+        # with a minimal improvement, a value that improves on a value earlier
+        # in the batch isn't always an improvement, so all values need to be
+        # checked in order
+        if self._min_relative_improvement:
+            super().check_new_values(values)
+            return
+
+        values = numpy.asarray(values)
+
+        if values.size == 0:
+            return
+
+        # the best value decides if there was an improvement
+        sign = self._sign
+        best_value = values[(sign * values).argmin()]
+
+        if sign * best_value < self._threshold:
+            self._remaining = self._max_iterations + 1
+            self._set_best_value(best_value)
 
     def reset(self):
         """Resets the object back to it's state after init.
@@ -292,12 +435,13 @@ class NoImprovementTerminationCriterion(AbstractTerminationCriterion):
         """
 
         self._run = True
-        self._iterations = 0
+        self._remaining = self._max_iterations
+        self._threshold = numpy.float64("inf")
 
         # restore old_best value
-        if self._function is smaller:
+        if self._sign == 1:
             # if minimising
-            self._old_best_value = float("inf")
+            self._old_best_value = numpy.float64("inf")
         else:
             # if maximising
-            self._old_best_value = float("-inf")
+            self._old_best_value = numpy.float64("-inf")
@@ -14,9 +14,11 @@ setuptools.setup(
     url="https://github.com/nobody1570/lclpy",
     packages=setuptools.find_packages(),
     install_requires=[
-        'matplotlib>=3.0.2',
-        'numpy>=1.15.4',
+        'numpy>=1.17.0',
     ],
+    extras_require={
+        'plot': ['matplotlib>=3.0.2'],
+    },
     python_requires=">=3.7",
     classifiers=[
         "Programming Language :: Python :: 3",